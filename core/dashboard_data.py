@@ -0,0 +1,272 @@
+"""
+Dashboard payload building and caching.
+
+The dashboard shows the last 7 scrape dates grouped by program. Data only
+changes when scrapers run, so the cron write-path precomputes the payload
+into the dashboard_cache table and the dashboard reads a single row. Each
+payload records the newest applicant_counts row it was built from, and is
+rebuilt when newer data exists or it is older than CACHE_MAX_AGE.
+"""
+
+import os
+import re
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict, Any
+
+from .logging_config import get_logger
+from .storage import Storage
+
+
+logger = get_logger(__name__)
+
+# Short Russian month names for date column headers ("22 июл")
+MONTHS_RU = ('янв', 'фев', 'мар', 'апр', 'май', 'июн',
+             'июл', 'авг', 'сен', 'окт', 'ноя', 'дек')
+
+# University by scraper_id prefix (the part before the first '_')
+_UNIVERSITIES = {
+    'hse': 'НИУ ВШЭ',
+    'mipt': 'МФТИ',
+    'mephi': 'МИФИ',
+}
+
+# Rebuild a cached payload older than this even if no newer rows are
+# detected (same-day rewrites keep the original created_at)
+CACHE_MAX_AGE = int(os.getenv('DASHBOARD_CACHE_MAX_AGE', '3600'))
+
+# Columns returned by recent_successful_results that the row loop reads
+_ROW_FIELDS = itemgetter('scraper_id', 'name', 'date', 'count')
+
+# University prefixes stripped from scraper names by program_key_for, in match
+# order ('НИЯУ МИФИ - ' before 'МИФИ - ')
+PROGRAM_NAME_PREFIXES = ('HSE - ', 'МФТИ - ', 'НИЯУ МИФИ - ', 'МИФИ - ', 'MEPhI - ')
+
+# University prefix stripped from program names ("HSE - <program>")
+_NAME_PREFIX_RE = re.compile(r'^(?:HSE|МФТИ|НИЯУ МИФИ) - ')
+
+
+def university_for(scraper_id: str, default: str = 'Unknown') -> str:
+    """Return the university name for a scraper_id (e.g. 'hse_online_ai')."""
+    return _UNIVERSITIES.get(scraper_id.partition('_')[0], default)
+
+
+def program_key_for(scraper_id: str, name: str) -> str:
+    """
+    Return the "<university> - <program>" key for a scraper.
+    
+    The first matching PROGRAM_NAME_PREFIXES entry is stripped from the name,
+    so ('hse_online_ai', 'HSE - AI') gives 'НИУ ВШЭ - AI'.
+    """
+    for prefix in PROGRAM_NAME_PREFIXES:
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+            break
+    return f"{university_for(scraper_id)} - {name}"
+
+
+def clean_program_name(name: str) -> str:
+    """Strip the university prefix from a program name ("HSE - AI" -> "AI")."""
+    return _NAME_PREFIX_RE.sub('', name, count=1)
+
+
+def _source_marker(storage: Storage) -> Dict[str, Any]:
+    """Return the date and created_at of the newest successful applicant_counts row."""
+    response = storage.client.table('applicant_counts')\
+        .select('date, created_at')\
+        .eq('status', 'success')\
+        .order('date', desc=True)\
+        .order('created_at', desc=True)\
+        .limit(1)\
+        .execute()
+    return response.data[0] if response.data else {}
+
+
+def build_dashboard_payload(storage: Storage) -> Dict[str, Any]:
+    """
+    Query the last 7 scrape dates and group the results by program.
+    
+    Args:
+        storage: Storage instance
+    
+    Returns:
+        JSON-serializable template context for dashboard.html
+    """
+    # Read the marker first: rows written after it only make the cache
+    # look stale, never fresh
+    source = _source_marker(storage)
+    
+    # Successful rows for the 7 most recent dates in one round trip (see
+    # recent_successful_results in sql/create_tables.sql), newest first
+    all_results = storage.client.rpc('recent_successful_results', {'n': 7}).execute()
+    unique_dates = list(dict.fromkeys(r['date'] for r in all_results.data))
+    
+    if not unique_dates:
+        # No data available
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'source': source,
+            'date': None,
+            'total': 0,
+            'success': 0,
+            'errors': 0,
+            'success_rate': 0,
+            'programs_data': {},
+            'date_columns': [],
+            'recent_dates': []
+        }
+    
+    today_date = unique_dates[0]
+    
+    # Organize data by program (like Google Sheets), counting today's
+    # (most recent date's) results in the same pass
+    programs_data = {}
+    total = 0
+    
+    for result in all_results.data:
+        scraper_id, name, result_date, count = _ROW_FIELDS(result)
+        if result_date == today_date:
+            total += 1
+        
+        university = university_for(scraper_id)
+        
+        # Clean program name
+        program_name = clean_program_name(name or scraper_id)
+        
+        program_key = f"{university} - {program_name}"
+        program_data = programs_data.get(program_key)
+        if program_data is None:
+            program_data = programs_data[program_key] = {
+                'university': university,
+                'program': program_name,
+                'counts_by_date': {},
+                'growth_percentage': None
+            }
+        
+        program_data['counts_by_date'][result_date] = count
+    
+    # Growth from earliest to latest available date, over the merged counts
+    # of each program (several scraper_ids can share one program key)
+    for program_data in programs_data.values():
+        counts = program_data['counts_by_date']
+        program_dates = sorted(d for d, c in counts.items() if c is not None)
+        if len(program_dates) < 2:
+            continue
+        
+        earliest_count = counts[program_dates[0]]
+        latest_count = counts[program_dates[-1]]
+        if earliest_count > 0:
+            growth = ((latest_count - earliest_count) / earliest_count) * 100
+            program_data['growth_percentage'] = round(growth, 1)
+            
+            # Store info about date range for debugging
+            program_data['growth_period'] = {
+                'from_date': program_dates[0],
+                'to_date': program_dates[-1],
+                'from_count': earliest_count,
+                'to_count': latest_count
+            }
+    
+    success = total  # We only get successful results
+    errors = 0  # We'll calculate this separately if needed
+    success_rate = 100 if total > 0 else 0
+    
+    # Format date columns for display
+    date_columns = []
+    for date_str in unique_dates:
+        try:
+            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+            formatted_date = f"{date_obj.day} {MONTHS_RU[date_obj.month - 1]}"
+            date_columns.append({
+                'date': date_str,
+                'formatted': formatted_date
+            })
+        except ValueError:
+            date_columns.append({
+                'date': date_str,
+                'formatted': date_str
+            })
+    
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'source': source,
+        'date': today_date,
+        'total': total,
+        'success': success,
+        'errors': errors,
+        'success_rate': success_rate,
+        'programs_data': programs_data,
+        'date_columns': date_columns,
+        'recent_dates': unique_dates
+    }
+
+
+def refresh_dashboard_cache(storage: Storage) -> bool:
+    """
+    Rebuild the dashboard payload and store it in dashboard_cache.
+    
+    Args:
+        storage: Storage instance
+    
+    Returns:
+        True if the cache row was written
+    """
+    payload = build_dashboard_payload(storage)
+    if payload['date'] is None:
+        return False
+    
+    _store_payload(storage, payload)
+    logger.info(f"Dashboard cache refreshed for {payload['date']} ({len(payload['programs_data'])} programs)")
+    return True
+
+
+def _store_payload(storage: Storage, payload: Dict[str, Any]) -> None:
+    """Upsert a payload into dashboard_cache, keyed by its date."""
+    storage.client.table('dashboard_cache')\
+        .upsert({'date': payload['date'], 'payload': payload, 'updated_at': datetime.now().isoformat()},
+                on_conflict='date')\
+        .execute()
+
+
+def _is_fresh(storage: Storage, payload: Dict[str, Any]) -> bool:
+    """Check that a cached payload is recent and built from the newest data."""
+    try:
+        age = (datetime.now() - datetime.fromisoformat(payload['generated_at'])).total_seconds()
+    except (KeyError, TypeError, ValueError):
+        return False
+    if age > CACHE_MAX_AGE:
+        return False
+    return payload.get('source') == _source_marker(storage)
+
+
+def load_dashboard_payload(storage: Storage) -> Dict[str, Any]:
+    """
+    Return the latest precomputed dashboard payload.
+    
+    Rebuilds it from applicant_counts (and stores the result) when the cache
+    is empty, unavailable, or stale.
+    
+    Args:
+        storage: Storage instance
+    
+    Returns:
+        Template context for dashboard.html
+    """
+    try:
+        response = storage.client.table('dashboard_cache')\
+            .select('payload')\
+            .order('date', desc=True)\
+            .limit(1)\
+            .execute()
+        if response.data and _is_fresh(storage, response.data[0]['payload']):
+            return response.data[0]['payload']
+    except Exception as e:
+        logger.warning(f"Dashboard cache unavailable, building payload directly: {e}")
+    
+    payload = build_dashboard_payload(storage)
+    if payload['date'] is not None:
+        try:
+            _store_payload(storage, payload)
+        except Exception as e:
+            logger.warning(f"Failed to store rebuilt dashboard payload: {e}")
+    return payload
@@ -13,6 +13,7 @@ from datetime import datetime, date
 from typing import Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
 
+from .dashboard_data import MONTHS_RU, clean_program_name, university_for
 from .logging_config import get_logger
 from .storage import Storage
 
@@ -489,7 +490,7 @@ class DynamicSheetsManager:
             # Get data from database
             storage = Storage()
             result = storage.client.table('applicant_counts')\
-                .select('*')\
+                .select('scraper_id, name, count')\
                 .eq('date', target_date)\
                 .eq('status', 'success')\
                 .order('name')\
@@ -507,24 +508,10 @@ class DynamicSheetsManager:
             
             for record in result.data:
                 scraper_id = record['scraper_id']
-                if scraper_id.startswith('hse_'):
-                    university = 'НИУ ВШЭ'
-                elif scraper_id.startswith('mipt_'):
-                    university = 'МФТИ'
-                elif scraper_id.startswith('mephi_'):
-                    university = 'МИФИ'
-                else:
-                    university = 'Unknown'
-                
-                program_name = record.get('name', record['scraper_id'])
+                university = university_for(scraper_id)
                 
-                # Clean program name
-                if program_name.startswith('HSE - '):
-                    program_name = program_name[6:]
-                elif program_name.startswith('МФТИ - '):
-                    program_name = program_name[7:]
-                elif program_name.startswith('НИЯУ МИФИ - '):
-                    program_name = program_name[12:]
+                # Clean program name - remove university prefix if present
+                program_name = clean_program_name(record.get('name', record['scraper_id']))
                 
                 program_key = f"{university} - {program_name}"
                 
@@ -719,9 +706,7 @@ class DynamicSheetsManager:
             
             # Format date for column header (DD месяц)
             date_obj = datetime.strptime(target_date, '%Y-%m-%d')
-            months = ['янв', 'фев', 'мар', 'апр', 'май', 'июн',
-                     'июл', 'авг', 'сен', 'окт', 'ноя', 'дек']
-            formatted_date = f"{date_obj.day} {months[date_obj.month - 1]}"
+            formatted_date = f"{date_obj.day} {MONTHS_RU[date_obj.month - 1]}"
             
             logger.info(f"Updating dynamic sheet for {formatted_date} ({target_date})")
             
@@ -749,7 +734,7 @@ class DynamicSheetsManager:
             # Get data from database
             storage = Storage()
             result = storage.client.table('applicant_counts')\
-                .select('*')\
+                .select('scraper_id, name, count')\
                 .eq('date', target_date)\
                 .eq('status', 'success')\
                 .order('name')\
@@ -769,24 +754,10 @@ class DynamicSheetsManager:
             for record in result.data:
                 # Determine university and create key
                 scraper_id = record['scraper_id']
-                if scraper_id.startswith('hse_'):
-                    university = 'НИУ ВШЭ'
-                elif scraper_id.startswith('mipt_'):
-                    university = 'МФТИ'
-                elif scraper_id.startswith('mephi_'):
-                    university = 'МИФИ'
-                else:
-                    university = 'Unknown'
-                
-                program_name = record.get('name', record['scraper_id'])
+                university = university_for(scraper_id)
                 
                 # Clean program name - remove university prefix if present
-                if program_name.startswith('HSE - '):
-                    program_name = program_name[6:]  # Remove "HSE - "
-                elif program_name.startswith('МФТИ - '):
-                    program_name = program_name[7:]  # Remove "МФТИ - "
-                elif program_name.startswith('НИЯУ МИФИ - '):
-                    program_name = program_name[12:]  # Remove "НИЯУ МИФИ - "
+                program_name = clean_program_name(record.get('name', record['scraper_id']))
                 
                 program_key = f"{university} - {program_name}"
                 
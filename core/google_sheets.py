@@ -12,6 +12,7 @@ from datetime import datetime, date, timedelta
 from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
 
+from .dashboard_data import university_for
 from .logging_config import get_logger
 from .storage import Storage
 
@@ -162,7 +163,7 @@ class GoogleSheetsSync:
             # Get data from database
             storage = Storage()
             result = storage.client.table('applicant_counts')\
-                .select('*')\
+                .select('id, scraper_id, name, count')\
                 .eq('date', target_date)\
                 .eq('status', 'success')\
                 .order('name')\
@@ -190,19 +191,8 @@ class GoogleSheetsSync:
             
             # Data rows
             for record in result.data:
-                # Determine university
-                scraper_id = record['scraper_id']
-                if scraper_id.startswith('hse_'):
-                    university = 'НИУ ВШЭ'
-                elif scraper_id.startswith('mipt_'):
-                    university = 'МФТИ'
-                elif scraper_id.startswith('mephi_'):
-                    university = 'МИФИ'
-                else:
-                    university = 'Unknown'
-                
                 row = [
-                    university,
+                    university_for(record['scraper_id']),
                     record.get('name', record['scraper_id']),
                     record.get('count', 0),
                     target_date,
@@ -1,7 +1,11 @@
 """HTTP client with timeouts and retry logic for reliable scraping."""
 
+import hashlib
+import json
+import os
 import httpx
 import time
+from pathlib import Path
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 
@@ -10,6 +14,10 @@ from .logging_config import get_logger, log_performance
 
 logger = get_logger(__name__)
 
+# Directory for revalidated GET responses (e.g. a mounted volume on Railway);
+# caching is disabled when unset
+HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR')
+
 
 class ReliableHTTPClient:
     """
@@ -23,7 +31,8 @@ class ReliableHTTPClient:
                  connect_timeout: float = 10.0, 
                  read_timeout: float = 30.0,
                  max_retries: int = 3,
-                 retry_delay: float = 1.0):
+                 retry_delay: float = 1.0,
+                 cache_dir: Optional[str] = HTTP_CACHE_DIR):
         """
         Initialize reliable HTTP client.
         
@@ -33,6 +42,7 @@ class ReliableHTTPClient:
             read_timeout: Read timeout in seconds
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
+            cache_dir: Directory for conditional GET caching (None disables it)
         """
         self.timeout = httpx.Timeout(
             timeout=timeout,
@@ -41,6 +51,7 @@ class ReliableHTTPClient:
         )
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         
         # Create client with timeouts
         self.client = httpx.Client(
@@ -65,7 +76,68 @@ class ReliableHTTPClient:
         Raises:
             Exception: If all retries failed
         """
-        return self._request_with_retries("GET", url, **kwargs)
+        if self.cache_dir is None:
+            return self._request_with_retries("GET", url, **kwargs)
+        return self._cached_get(url, **kwargs)
+    
+    def _cached_get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        GET with on-disk ETag/Last-Modified revalidation.
+        
+        Cached bodies are never served without asking the server: a 304 reply
+        reuses the stored body and skips the download, anything else replaces it.
+        """
+        # Key on the full request URL, so GETs differing only in params=
+        # never share (and revalidate against) one entry
+        full_url = str(httpx.URL(url, params=kwargs.get('params')))
+        key = hashlib.sha1(full_url.encode()).hexdigest()
+        meta_path = self.cache_dir / f"{key}.json"
+        body_path = self.cache_dir / f"{key}.body"
+        
+        meta = None
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            pass
+        
+        headers = dict(kwargs.pop('headers', None) or {})
+        if meta and body_path.exists():
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        
+        response = self._request_with_retries("GET", url, headers=headers, **kwargs)
+        
+        if response.status_code == 304 and meta:
+            logger.debug(f"Not modified, using cached body for {urlparse(url).netloc}")
+            return httpx.Response(
+                200,
+                headers=meta['headers'],
+                content=body_path.read_bytes(),
+                request=response.request
+            )
+        
+        etag = response.headers.get('etag')
+        last_modified = response.headers.get('last-modified')
+        if etag or last_modified:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                body_path.write_bytes(response.content)
+                # Body is already decoded, so drop transfer-related headers
+                cached_headers = {
+                    k: v for k, v in response.headers.items()
+                    if k.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')
+                }
+                meta_path.write_text(json.dumps({
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'headers': cached_headers
+                }))
+            except OSError as e:
+                logger.warning(f"Could not write HTTP cache entry for {urlparse(url).netloc}: {e}")
+        
+        return response
     
     def post(self, url: str, **kwargs) -> httpx.Response:
         """Reliable POST request with timeouts and retries."""
@@ -107,8 +179,9 @@ class ReliableHTTPClient:
                 duration = time.time() - start_time
                 log_performance(f"http_{method.lower()}", duration, f"domain={domain}, status={response.status_code}")
                 
-                # Check for HTTP errors
-                response.raise_for_status()
+                # Check for HTTP errors (304 answers our own conditional GET)
+                if response.status_code != 304:
+                    response.raise_for_status()
                 
                 if attempt > 0:
                     logger.info(f"Request succeeded on retry {attempt} for {domain}")
@@ -4,36 +4,66 @@ import logging
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 
+_DETAILED_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+_CONSOLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+
+
+# (level, log dir, date) of the last setup_logging() call
+_CONFIGURED = None
+
+
+@lru_cache(maxsize=256)
+def _is_scraper_logger(name: str) -> bool:
+    """Check (once per logger name) whether a logger belongs to scrapers."""
+    return 'scraper' in name.lower()
+
+
+class _ScrapingFilter(logging.Filter):
+    """Pass only records coming from scraper loggers or mentioning scraping."""
+    
+    def filter(self, record):
+        return _is_scraper_logger(record.name) or 'scraping' in record.getMessage().lower()
+
+
 def setup_logging(log_level: str = "INFO", log_dir: str = "logs") -> None:
     """
     Set up logging configuration for the entire project.
     
+    Repeated calls with the same level and directory on the same day are
+    no-ops; a new day (or different arguments) reopens the dated log files.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: Directory to store log files
     """
+    global _CONFIGURED
+    
     # Get log level from environment or use provided default
     level_name = os.environ.get("LOG_LEVEL", log_level).upper()
     level = getattr(logging, level_name, logging.INFO)
     
+    # One date string shared by all log files of this setup
+    today = datetime.now().strftime("%Y-%m-%d")
+    
+    config_key = (level, str(Path(log_dir).absolute()), today)
+    if _CONFIGURED == config_key and logging.getLogger().handlers:
+        return
+    
     # Create logs directory
     log_path = Path(log_dir)
     log_path.mkdir(exist_ok=True)
     
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    console_formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S'
-    )
-    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
@@ -41,40 +71,34 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs") -> None:
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.close()
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     root_logger.addHandler(console_handler)
     
     # File handler for all logs
-    today = datetime.now().strftime("%Y-%m-%d")
     all_logs_file = log_path / f"edu-parser-{today}.log"
     file_handler = logging.FileHandler(all_logs_file)
     file_handler.setLevel(logging.DEBUG)  # Always capture DEBUG in files
-    file_handler.setFormatter(detailed_formatter)
+    file_handler.setFormatter(_DETAILED_FORMATTER)
     root_logger.addHandler(file_handler)
     
     # Error file handler
     error_file = log_path / f"errors-{today}.log"
     error_handler = logging.FileHandler(error_file)
     error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(detailed_formatter)
+    error_handler.setFormatter(_DETAILED_FORMATTER)
     root_logger.addHandler(error_handler)
     
     # Scraping results file handler
     results_file = log_path / f"scraping-results-{today}.log"
     results_handler = logging.FileHandler(results_file)
     results_handler.setLevel(logging.INFO)
-    results_handler.setFormatter(detailed_formatter)
-    
-    # Create a filter for scraping-specific logs
-    class ScrapingFilter(logging.Filter):
-        def filter(self, record):
-            return 'scraper' in record.name.lower() or 'scraping' in record.getMessage().lower()
-    
-    results_handler.addFilter(ScrapingFilter())
+    results_handler.setFormatter(_DETAILED_FORMATTER)
+    results_handler.addFilter(_ScrapingFilter())
     root_logger.addHandler(results_handler)
     
     # Configure specific loggers
@@ -89,6 +113,7 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "logs") -> None:
     logging.getLogger('scrapers').setLevel(level)
     logging.getLogger('sync').setLevel(level)
     
+    _CONFIGURED = config_key
     root_logger.info(f"Logging initialized - Level: {level_name}, Logs dir: {log_path.absolute()}")
 
 
@@ -133,6 +158,9 @@ def log_performance(operation: str, duration: float, details: str = None) -> Non
         details: Additional details about the operation
     """
     logger = get_logger('performance')
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     message = f"PERFORMANCE: {operation} took {duration:.2f}s"
     if details:
         message += f" - {details}"
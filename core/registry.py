@@ -1,8 +1,7 @@
 """Scraper registry for automatic discovery and registration of scrapers."""
 
 import importlib
-import inspect
-from pathlib import Path
+from functools import lru_cache
 from typing import Dict, List, Callable, Tuple
 import pkgutil
 
@@ -13,6 +12,38 @@ from .storage import Storage
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _find_spec(importer, modname: str):
+    """Resolve (and cache) the module spec without importing the module."""
+    return importer.find_spec(modname)
+
+
+def _declares_get_scrapers(importer, modname: str) -> bool:
+    """
+    Cheap pre-import check that a module source defines get_scrapers().
+    
+    Falls back to True when the source can't be inspected, so the import
+    itself decides in that case.
+    """
+    if importer is None or not hasattr(importer, 'find_spec'):
+        return True
+    
+    try:
+        spec = _find_spec(importer, modname)
+    except Exception:
+        return True
+    
+    origin = getattr(spec, 'origin', None)
+    if not origin or not origin.endswith('.py'):
+        return True
+    
+    try:
+        with open(origin, 'r', encoding='utf-8') as f:
+            return 'def get_scrapers' in f.read()
+    except OSError:
+        return True
+
+
 class ScraperRegistry:
     """
     Automatic scraper registry.
@@ -53,14 +84,19 @@ class ScraperRegistry:
                     continue
                     
                 full_module_name = f"{package_name}.{modname}"
-                logger.debug(f"Scanning module: {full_module_name}")
+                logger.debug("Scanning module: %s", full_module_name)
+                
+                # Skip modules that can't provide get_scrapers() without importing them
+                if not _declares_get_scrapers(importer, modname):
+                    logger.debug("No get_scrapers() function found in %s", full_module_name)
+                    continue
                 
                 try:
                     module = importlib.import_module(full_module_name)
                     
                     # Look for get_scrapers() function
                     if hasattr(module, 'get_scrapers') and callable(getattr(module, 'get_scrapers')):
-                        logger.debug(f"Found get_scrapers() in {full_module_name}")
+                        logger.debug("Found get_scrapers() in %s", full_module_name)
                         
                         # Call get_scrapers() to get configured scrapers
                         scrapers_list = module.get_scrapers()
@@ -75,11 +111,11 @@ class ScraperRegistry:
                                     'config': config
                                 }
                                 discovered += 1
-                                logger.debug(f"Discovered scraper: {scraper_id} from {modname}")
+                                logger.debug("Discovered scraper: %s from %s", scraper_id, modname)
                         
                         logger.info(f"Loaded {len(scrapers_list)} scrapers from {modname}")
                     else:
-                        logger.debug(f"No get_scrapers() function found in {full_module_name}")
+                        logger.debug("No get_scrapers() function found in %s", full_module_name)
                 
                 except Exception as e:
                     logger.error(f"Error importing module {full_module_name}: {e}")
@@ -91,23 +127,6 @@ class ScraperRegistry:
             logger.error(f"Error discovering scrapers: {e}")
             return 0
     
-    def _is_scraper_function(self, name: str, func: Callable) -> bool:
-        """Check if function looks like a scraper."""
-        # Look for scraper naming patterns
-        scraper_patterns = ['scrape_', 'get_', 'fetch_']
-        return any(name.startswith(pattern) for pattern in scraper_patterns)
-    
-    def _extract_scraper_id(self, func_name: str, module_name: str) -> str:
-        """Extract scraper_id from function name and module."""
-        # Remove scrape_ prefix if present
-        if func_name.startswith('scrape_'):
-            base_name = func_name[7:]  # Remove 'scrape_'
-        else:
-            base_name = func_name
-        
-        # Construct scraper_id: university_program
-        return f"{module_name}_{base_name}"
-    
     def load_enabled_scrapers(self) -> List[Tuple[Callable, Dict]]:
         """
         Load scrapers that are enabled in database.
@@ -135,7 +154,7 @@ class ScraperRegistry:
                 # Use the merged config (database config takes precedence)
                 merged_config = {**scraper_info.get('config', {}), **config}
                 ready_scrapers.append((scraper_info['function'], merged_config))
-                logger.debug(f"Matched scraper: {scraper_id}")
+                logger.debug("Matched scraper: %s", scraper_id)
             else:
                 logger.warning(f"Scraper function not found for enabled config: {scraper_id}")
         
@@ -224,6 +243,19 @@ class ScraperRegistry:
 
 # Convenience functions for easy usage
 
+@lru_cache(maxsize=1)
+def _default_registry() -> ScraperRegistry:
+    """
+    Shared registry used by the convenience functions.
+    
+    Discovery runs once per process; call _default_registry.cache_clear()
+    to force a fresh registry (e.g. in tests).
+    """
+    registry = ScraperRegistry()
+    registry.discover_scrapers()
+    return registry
+
+
 def get_ready_scrapers() -> List[Tuple[Callable, Dict]]:
     """
     Get all ready-to-run scrapers in one function call.
@@ -231,9 +263,7 @@ def get_ready_scrapers() -> List[Tuple[Callable, Dict]]:
     Returns:
         List of (scraper_function, config) tuples for enabled scrapers
     """
-    registry = ScraperRegistry()
-    registry.discover_scrapers()
-    return registry.load_enabled_scrapers()
+    return _default_registry().load_enabled_scrapers()
 
 
 def get_all_scrapers() -> List[Tuple[Callable, Dict]]:
@@ -243,13 +273,9 @@ def get_all_scrapers() -> List[Tuple[Callable, Dict]]:
     Returns:
         List of (scraper_function, config) tuples for all discovered scrapers
     """
-    registry = ScraperRegistry()
-    registry.discover_scrapers()
-    return registry.get_all_discovered_scrapers()
+    return _default_registry().get_all_discovered_scrapers()
 
 
 def get_scraper_summary() -> Dict:
     """Get summary of scraper discovery and matching."""
-    registry = ScraperRegistry()
-    registry.discover_scrapers()
-    return registry.get_scraper_info()
\ No newline at end of file
+    return _default_registry().get_scraper_info()
@@ -34,13 +34,16 @@ class ScraperRunner:
         
         logger.info(f"ScraperRunner initialized with max_workers={max_workers}")
     
-    def run_scraper_isolated(self, scraper_func: Callable, scraper_config: Dict[str, Any]) -> Dict[str, Any]:
+    def run_scraper_isolated(self, scraper_func: Callable, scraper_config: Dict[str, Any],
+                             save: bool = True) -> Dict[str, Any]:
         """
         Run a single scraper in complete isolation.
         
         Args:
             scraper_func: The scraper function to execute
             scraper_config: Configuration for this scraper
+            save: Save the result to the database immediately. Batch runs
+                  pass False and save all results in one request instead.
             
         Returns:
             Result dictionary with success/error information
@@ -68,7 +71,7 @@ class ScraperRunner:
             log_performance(f"scraper_{scraper_id}", duration, f"status={result.get('status')}")
             
             # Save to database immediately
-            if self.storage:
+            if save and self.storage:
                 saved = self.storage.save_result(result)
                 if not saved:
                     logger.error(f"Failed to save result for {scraper_id} to database")
@@ -95,7 +98,7 @@ class ScraperRunner:
             
             # Try to save error result
             try:
-                if self.storage:
+                if save and self.storage:
                     self.storage.save_result(error_result)
             except Exception as save_error:
                 logger.error(f"Failed to save error result for {scraper_id}: {save_error}")
@@ -125,7 +128,7 @@ class ScraperRunner:
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit all scrapers
             future_to_scraper = {
-                executor.submit(self.run_scraper_isolated, func, config): config.get('scraper_id', 'unknown')
+                executor.submit(self.run_scraper_isolated, func, config, False): config.get('scraper_id', 'unknown')
                 for func, config in scraper_functions
             }
             
@@ -152,6 +155,12 @@ class ScraperRunner:
                     }
                     results.append(error_result)
         
+        # Save all results in a single batch request
+        if self.storage and results:
+            saved = self.storage.batch_save_results(results)
+            if saved < len(results):
+                logger.error(f"Saved only {saved}/{len(results)} results to database")
+        
         # Summary statistics
         total_duration = time.time() - start_time
         successful = sum(1 for r in results if r.get('status') == 'success')
@@ -1,19 +1,153 @@
 """Core storage module for interacting with Supabase database."""
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+import httpx
 from supabase import create_client, Client
+from postgrest import CountMethod, ReturnMethod
 from dotenv import load_dotenv
 
 from .logging_config import get_logger, log_performance
 import time
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to httpx's stdlib json encoding
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
 logger = get_logger(__name__)
 
+# Supabase clients shared by all Storage instances, keyed by (url, key)
+_clients: Dict[Tuple[str, str], Client] = {}
+_clients_lock = threading.Lock()
+
+
+# In-process cache of enabled scraper configs (the table changes rarely)
+_SCRAPERS_CACHE_TTL = 60  # seconds
+_enabled_scrapers_cache: Dict[str, Any] = {'ts': 0.0, 'data': None}
+
+# Maximum number of ids per in_() filter, keeps request URLs short
+_IN_FILTER_CHUNK_SIZE = 500
+
+# Result validation rules, built once at import
+_REQUIRED_RESULT_FIELDS = frozenset(('scraper_id', 'name', 'status'))
+_VALID_STATUSES = frozenset(('success', 'error'))
+
+
+def _validate_result(result: Dict[str, Any]) -> Optional[str]:
+    """
+    Validate a scraping result dictionary.
+    
+    Returns:
+        None if the result is valid, otherwise a description of the problem.
+    """
+    if not _REQUIRED_RESULT_FIELDS.issubset(result.keys()):
+        missing = ', '.join(sorted(_REQUIRED_RESULT_FIELDS.difference(result.keys())))
+        return f"Missing required field: {missing}"
+    
+    if result['status'] not in _VALID_STATUSES:
+        return f"Invalid status: {result['status']}. Must be 'success' or 'error'"
+    
+    return None
+
+
+def _build_row(result: Dict[str, Any], today: str) -> Dict[str, Any]:
+    """
+    Build an applicant_counts row from a validated result.
+    
+    Optional fields are only included when set, so the database
+    applies its defaults.
+    """
+    row = {
+        'scraper_id': result['scraper_id'],
+        'name': result['name'],
+        'status': result['status'],
+        'date': today,
+        'synced_to_sheets': False
+    }
+    
+    count = result.get('count')
+    if count is not None:
+        row['count'] = count
+    
+    error = result.get('error')
+    if error is not None:
+        row['error'] = error
+    
+    return row
+
+
+def _use_http2(client: Client) -> None:
+    """
+    Swap the PostgREST session for a keep-alive HTTP/2 httpx client.
+    
+    Concurrent chunk upserts then share one TLS connection as multiplexed
+    streams. Keeps the default session if the h2 package is not installed.
+    """
+    session = client.postgrest.session
+    
+    try:
+        http2_session = httpx.Client(
+            base_url=session.base_url,
+            headers=session.headers,
+            timeout=session.timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+    except ImportError:
+        logger.debug("h2 not installed, keeping HTTP/1.1 session for Supabase")
+        return
+    except Exception as e:
+        logger.warning(f"Could not create HTTP/2 session, keeping default: {e}")
+        return
+    
+    client.postgrest.session = http2_session
+    session.close()
+
+
+def _use_fast_json(client: Client) -> None:
+    """
+    Encode PostgREST request bodies with orjson when it is installed.
+    
+    postgrest-py hands request bodies to httpx as json=..., which uses the
+    stdlib encoder; pre-encoding with orjson is several times faster for
+    large upsert batches.
+    """
+    if orjson is None:
+        return
+    
+    session = client.postgrest.session
+    original_request = session.request
+    
+    def request(method, url, **kwargs):
+        payload = kwargs.pop('json', None)
+        if payload is not None:
+            kwargs['content'] = orjson.dumps(payload)
+            headers = dict(kwargs.get('headers') or {})
+            headers['Content-Type'] = 'application/json'
+            kwargs['headers'] = headers
+        return original_request(method, url, **kwargs)
+    
+    session.request = request
+
+
+def _get_client(url: str, key: str) -> Client:
+    """Return the process-wide Supabase client for url/key, creating it once."""
+    with _clients_lock:
+        client = _clients.get((url, key))
+        if client is None:
+            client = create_client(url, key)
+            _use_http2(client)
+            _use_fast_json(client)
+            _clients[(url, key)] = client
+        return client
+
 
 class StorageError(Exception):
     """Custom exception for storage-related errors."""
@@ -28,10 +162,16 @@ class Storage:
     and providing monitoring functionality.
     """
     
-    def __init__(self):
+    def __init__(self, batch_chunk_size: int = 500, max_concurrent_chunks: int = 8):
         """
         Initialize Storage with Supabase client.
         
+        Args:
+            batch_chunk_size: Maximum number of rows sent per request
+                              in batch_save_results.
+            max_concurrent_chunks: Maximum number of chunk requests
+                                   batch_save_results keeps in flight.
+        
         Raises:
             StorageError: If environment variables are missing or connection fails.
         """
@@ -44,12 +184,16 @@ class Storage:
         if not key:
             raise StorageError("SUPABASE_KEY environment variable is required")
         
+        self.batch_chunk_size = max(1, batch_chunk_size)
+        self.max_concurrent_chunks = max(1, max_concurrent_chunks)
+        
         try:
-            self.client: Client = create_client(url, key)
+            self.client: Client = _get_client(url, key)
             logger.info("Storage initialized successfully")
             
-            # Test connection
-            self._test_connection()
+            # Test connection only when explicitly requested (costs a round-trip)
+            if os.environ.get('STORAGE_HEALTHCHECK') == '1':
+                self._test_connection()
             
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {e}")
@@ -88,48 +232,27 @@ class Storage:
         start_time = time.time()
         scraper_id = result.get('scraper_id', 'unknown')
         
-        logger.debug(f"Starting to save result for {scraper_id}")
-        
-        # Validate required fields
-        required_fields = ['scraper_id', 'name', 'status']
-        for field in required_fields:
-            if field not in result:
-                logger.error(f"Validation failed - Missing required field: {field} for {scraper_id}")
-                return False
+        logger.debug("Starting to save result for %s", scraper_id)
         
-        if result['status'] not in ['success', 'error']:
-            logger.error(f"Validation failed - Invalid status: {result['status']} for {scraper_id}. Must be 'success' or 'error'")
+        # Validate required fields and status
+        problem = _validate_result(result)
+        if problem:
+            logger.error(f"Validation failed - {problem} for {scraper_id}")
             return False
         
         try:
-            data = {
-                'scraper_id': result['scraper_id'],
-                'name': result['name'],
-                'count': result.get('count'),
-                'status': result['status'],
-                'error': result.get('error'),
-                'date': date.today().isoformat(),
-                'synced_to_sheets': False
-            }
+            data = _build_row(result, date.today().isoformat())
             
-            # Remove None values to let database handle defaults
-            data = {k: v for k, v in data.items() if v is not None}
-            
-            # UPSERT logic: first delete existing records for this scraper_id + date combination
+            # Native UPSERT: one INSERT ... ON CONFLICT (scraper_id, date) DO UPDATE
+            # (ignore_duplicates=False sends Prefer: resolution=merge-duplicates)
             today_str = data['date']
-            logger.debug(f"Performing UPSERT for {scraper_id} on {today_str}")
-            
-            # Delete existing records for this scraper + date
-            delete_response = self.client.table('applicant_counts')\
-                .delete()\
-                .eq('scraper_id', scraper_id)\
-                .eq('date', today_str)\
+            logger.debug("Performing UPSERT for %s on %s", scraper_id, today_str)
+            logger.debug("Upserting data for %s: %s", scraper_id, data)
+            response = self.client.table('applicant_counts')\
+                .upsert(data, on_conflict='scraper_id,date', ignore_duplicates=False,
+                        returning=ReturnMethod.minimal)\
                 .execute()
             
-            # Insert new record
-            logger.debug(f"Inserting data for {scraper_id}: {data}")
-            response = self.client.table('applicant_counts').insert(data).execute()
-            
             duration = time.time() - start_time
             logger.info(f"Successfully saved result for {scraper_id} (count: {result.get('count', 'N/A')})")
             log_performance("save_result", duration, f"scraper_id={scraper_id}")
@@ -145,10 +268,19 @@ class Storage:
         """
         Retrieve all enabled scraper configurations from the database.
         
+        Results are cached in-process for a short time; call
+        invalidate_scrapers_cache() after changing scrapers_config.
+        
         Returns:
             List of dictionaries containing scraper configuration data.
             Returns empty list if query fails.
         """
+        now = time.monotonic()
+        cached = _enabled_scrapers_cache['data']
+        if cached is not None and now - _enabled_scrapers_cache['ts'] < _SCRAPERS_CACHE_TTL:
+            logger.debug("Using %d cached enabled scrapers", len(cached))
+            return list(cached)
+        
         try:
             response = self.client.table('scrapers_config') \
                 .select('*') \
@@ -156,13 +288,18 @@ class Storage:
                 .order('scraper_id') \
                 .execute()
             
+            _enabled_scrapers_cache.update(ts=now, data=response.data)
             logger.info(f"Retrieved {len(response.data)} enabled scrapers")
-            return response.data
+            return list(response.data)
             
         except Exception as e:
             logger.error(f"Failed to get enabled scrapers: {e}")
             return []
     
+    def invalidate_scrapers_cache(self) -> None:
+        """Drop cached enabled scraper configs so the next read hits the database."""
+        _enabled_scrapers_cache.update(ts=0.0, data=None)
+    
     def get_today_results(self) -> List[Dict[str, Any]]:
         """
         Get all scraping results for today.
@@ -206,62 +343,110 @@ class Storage:
         
         # Prepare batch data
         for result in results:
-            # Validate required fields
-            required_fields = ['scraper_id', 'name', 'status']
-            if not all(field in result for field in required_fields):
-                logger.error(f"Skipping invalid result: {result}")
-                continue
-            
-            if result['status'] not in ['success', 'error']:
-                logger.error(f"Skipping result with invalid status: {result}")
+            # Validate required fields and status
+            problem = _validate_result(result)
+            if problem:
+                logger.error(f"Skipping invalid result ({problem}): {result}")
                 continue
             
-            data = {
-                'scraper_id': result['scraper_id'],
-                'name': result['name'],
-                'count': result.get('count'),
-                'status': result['status'],
-                'error': result.get('error'),
-                'date': today,
-                'synced_to_sheets': False
-            }
-            
-            # Remove None values
-            data = {k: v for k, v in data.items() if v is not None}
-            batch_data.append(data)
+            batch_data.append(_build_row(result, today))
         
         if not batch_data:
             logger.warning("No valid results to save in batch")
             return 0
         
-        try:
-            # UPSERT logic for batch: first delete all existing records for these scrapers + date
-            scraper_ids = [data['scraper_id'] for data in batch_data]
-            
-            logger.debug(f"Performing batch UPSERT for {len(scraper_ids)} scrapers on {today}")
+        # Rows already stored with identical values need no write
+        changed_data = self._diff_against_today(batch_data, today)
+        unchanged = len(batch_data) - len(changed_data)
+        if unchanged:
+            logger.info(f"Skipping {unchanged} results unchanged since last save")
+        
+        if not changed_data:
+            return len(batch_data)
+        
+        batch_data = changed_data
+        logger.debug("Performing batch UPSERT for %d scrapers on %s", len(batch_data), today)
+        
+        # Send rows in chunks so each request stays well under PostgREST limits
+        # and a failing chunk only retries its own rows
+        chunk_size = self.batch_chunk_size
+        chunks = [(start, batch_data[start:start + chunk_size])
+                  for start in range(0, len(batch_data), chunk_size)]
+        
+        if len(chunks) == 1:
+            successful_saves = self._upsert_with_bisect(*chunks[0])
+        else:
+            # Overlap the network round-trips of independent chunks
+            workers = min(self.max_concurrent_chunks, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                successful_saves = sum(executor.map(lambda c: self._upsert_with_bisect(*c), chunks))
+        
+        logger.info(f"Successfully saved {successful_saves}/{len(batch_data)} results in batch (UPSERT)")
+        return successful_saves + unchanged
+    
+    def _diff_against_today(self, batch_data: List[Dict[str, Any]], today: str) -> List[Dict[str, Any]]:
+        """
+        Drop rows whose values already match what is stored for today.
+        
+        Args:
+            batch_data: Prepared applicant_counts rows
+            today: ISO date the rows are saved under
             
-            # Delete existing records for these scrapers + date
-            delete_response = self.client.table('applicant_counts')\
-                .delete()\
-                .in_('scraper_id', scraper_ids)\
-                .eq('date', today)\
+        Returns:
+            Rows that are new or changed. All rows if the lookup fails.
+        """
+        try:
+            response = self.client.table('applicant_counts') \
+                .select('scraper_id, name, count, status, error') \
+                .eq('date', today) \
                 .execute()
+        except Exception as e:
+            logger.warning(f"Could not load today's results for comparison, saving all: {e}")
+            return batch_data
+        
+        stored = {
+            row['scraper_id']: (row.get('name'), row.get('count'), row.get('status'), row.get('error'))
+            for row in response.data
+        }
+        
+        return [
+            row for row in batch_data
+            if stored.get(row['scraper_id']) != (row.get('name'), row.get('count'), row['status'], row.get('error'))
+        ]
+    
+    def _upsert_with_bisect(self, start: int, rows: List[Dict[str, Any]]) -> int:
+        """
+        Upsert prepared rows, bisecting on failure to isolate bad rows.
+        
+        A failing request is split in half and each half retried, so a
+        single bad row costs O(log n) extra requests instead of n.
+        
+        Args:
+            start: Offset of the rows within the batch (for logging)
+            rows: Rows ready for the applicant_counts table
             
-            # Insert new records
-            response = self.client.table('applicant_counts').insert(batch_data).execute()
-            successful_saves = len(batch_data)
-            logger.info(f"Successfully saved {successful_saves} results in batch (UPSERT)")
-            return successful_saves
+        Returns:
+            Number of rows saved.
+        """
+        try:
+            # Native UPSERT: one INSERT ... ON CONFLICT (scraper_id, date) DO UPDATE
+            # (ignore_duplicates=False sends Prefer: resolution=merge-duplicates)
+            response = self.client.table('applicant_counts')\
+                .upsert(rows, on_conflict='scraper_id,date', ignore_duplicates=False,
+                        returning=ReturnMethod.minimal)\
+                .execute()
+            return len(rows)
             
         except Exception as e:
-            logger.error(f"Batch save failed, falling back to individual saves: {e}")
+            if len(rows) == 1:
+                logger.error(f"Failed to save result for {rows[0].get('scraper_id', 'unknown')} "
+                             f"(batch row {start}): {e}")
+                return 0
             
-            # Fallback to individual saves
-            for result in results:
-                if self.save_result(result):
-                    successful_saves += 1
-        
-        return successful_saves
+            logger.warning(f"Batch rows {start}-{start + len(rows) - 1} failed, retrying in halves: {e}")
+            middle = len(rows) // 2
+            return (self._upsert_with_bisect(start, rows[:middle]) +
+                    self._upsert_with_bisect(start + middle, rows[middle:]))
     
     def get_scraper_by_id(self, scraper_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -304,14 +489,20 @@ class Storage:
             return 0
         
         try:
-            # Update records in batch
-            response = self.client.table('applicant_counts') \
-                .update({'synced_to_sheets': True}) \
-                .in_('id', result_ids) \
-                .execute()
+            updated_count = 0
+            
+            # Update records in batches; the exact count comes back in the
+            # Content-Range header, so no rows need to be returned
+            for start in range(0, len(result_ids), _IN_FILTER_CHUNK_SIZE):
+                chunk = result_ids[start:start + _IN_FILTER_CHUNK_SIZE]
+                response = self.client.table('applicant_counts') \
+                    .update({'synced_to_sheets': True},
+                            count=CountMethod.exact, returning=ReturnMethod.minimal) \
+                    .in_('id', chunk) \
+                    .execute()
+                updated_count += response.count or 0
             
-            updated_count = len(result_ids)  # Assume success for all
-            logger.info(f"Marked {updated_count} results as synced to sheets")
+            logger.info(f"Marked {updated_count}/{len(result_ids)} results as synced to sheets")
             return updated_count
             
         except Exception as e:
@@ -59,6 +59,56 @@ CREATE TABLE scrapers_config (
 CREATE INDEX idx_applicant_counts_date ON applicant_counts(date);
 CREATE INDEX idx_applicant_counts_scraper ON applicant_counts(scraper_id);
 CREATE INDEX idx_applicant_counts_sync ON applicant_counts(synced_to_sheets);
+
+-- One result per scraper per day (conflict target for UPSERT in core/storage.py).
+-- On an existing database, run cleanup-applicant-duplicates.py first.
+CREATE UNIQUE INDEX idx_applicant_counts_scraper_date ON applicant_counts(scraper_id, date);
+
+-- Covers the dashboard/stats reads of successful rows by date (index-only scans).
+-- On an existing database, create it with CREATE INDEX CONCURRENTLY.
+CREATE INDEX idx_applicant_counts_success_date ON applicant_counts(date DESC, scraper_id)
+    INCLUDE (name, count) WHERE status = 'success';
+
+-- Per-day totals for the dashboard stats API (aggregated in Postgres
+-- instead of shipping every row to the app)
+CREATE OR REPLACE FUNCTION stats_by_date(start_date DATE, end_date DATE)
+RETURNS TABLE(date DATE, total INT, success INT, error INT, total_applicants BIGINT)
+LANGUAGE sql STABLE AS $$
+    SELECT applicant_counts.date,
+           COUNT(*)::INT,
+           (COUNT(*) FILTER (WHERE status = 'success'))::INT,
+           (COUNT(*) FILTER (WHERE status <> 'success'))::INT,
+           COALESCE(SUM(count) FILTER (WHERE status = 'success'), 0)
+    FROM applicant_counts
+    WHERE applicant_counts.date BETWEEN start_date AND end_date
+    GROUP BY applicant_counts.date
+    ORDER BY applicant_counts.date
+$$;
+
+-- Precomputed dashboard payload, written after each scraper run
+CREATE TABLE dashboard_cache (
+    date DATE PRIMARY KEY,
+    payload JSONB NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Successful results for the n most recent dates that have any (dashboard)
+DROP FUNCTION IF EXISTS recent_successful_results(INT);
+CREATE FUNCTION recent_successful_results(n INT)
+RETURNS TABLE(scraper_id TEXT, name TEXT, date DATE, count INT)
+LANGUAGE sql STABLE AS $$
+    SELECT a.scraper_id, a.name, a.date, a.count
+    FROM applicant_counts a
+    WHERE a.status = 'success'
+      AND a.date IN (
+          SELECT DISTINCT d.date
+          FROM applicant_counts d
+          WHERE d.status = 'success'
+          ORDER BY d.date DESC
+          LIMIT n
+      )
+    ORDER BY a.date DESC, a.name
+$$;
 """
         
         print(sql)
@@ -4,6 +4,7 @@ Standalone cron script for Railway cron service.
 This script runs scrapers without any web server components.
 """
 
+import logging
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -13,40 +14,54 @@ from scrapers.mipt import scrape_mipt
 from scrapers.mephi import scrape_mephi
 from storage.supabase_client import SupabaseStorage
 from config import Config
+from core.logging_config import setup_logging, get_logger
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from datetime import datetime
 
+# Upper bound for the whole concurrent scrape, in seconds
+SCRAPERS_TIMEOUT = 300
+
+DEBUG = os.environ.get('DEBUG_CRON') == '1'
+
+logger = get_logger(__name__)
+
+
 def main():
     """Run all scrapers and save results."""
-    print(f"🚀 Starting standalone cron scraper run at {datetime.now()}")
-    
-    # Detailed environment debugging for cron
-    print("🔍 DEBUG: cron-only.py environment analysis")
-    print(f"🔍 DEBUG: __file__ = {__file__}")
-    print(f"🔍 DEBUG: sys.argv = {sys.argv}")
-    print(f"🔍 DEBUG: Current working directory = {os.getcwd()}")
+    setup_logging(os.getenv('LOG_LEVEL', 'INFO'))
+    started_at = datetime.now()
+    logger.info(f"🚀 Starting standalone cron scraper run at {started_at}")
     
-    # Check PORT variable in cron environment
-    port_env = os.environ.get('PORT')
-    print(f"🔍 DEBUG: PORT environment variable in cron = '{port_env}' (type: {type(port_env)})")
-    
-    # Check all environment variables that might be relevant
-    relevant_vars = ['PORT', 'FLASK_DEBUG', 'SCRAPER_MODE', 'RAILWAY_CRON_SCHEDULE']
-    for var in relevant_vars:
-        value = os.environ.get(var)
-        print(f"🔍 DEBUG: {var} = '{value}'")
-    
-    # Check if this is being run as cron vs standalone
-    if 'cron' in ' '.join(sys.argv).lower() or os.environ.get('RAILWAY_CRON_SCHEDULE'):
-        print("🔍 DEBUG: Detected cron execution context")
-    else:
-        print("🔍 DEBUG: Detected standalone execution context")
+    # Detailed environment debugging for cron (opt-in with DEBUG_CRON=1)
+    if DEBUG:
+        logger.info("🔍 DEBUG: cron-only.py environment analysis")
+        logger.info(f"🔍 DEBUG: __file__ = {__file__}")
+        logger.info(f"🔍 DEBUG: sys.argv = {sys.argv}")
+        logger.info(f"🔍 DEBUG: Current working directory = {os.getcwd()}")
+        
+        # Check PORT variable in cron environment
+        port_env = os.environ.get('PORT')
+        logger.info(f"🔍 DEBUG: PORT environment variable in cron = '{port_env}' (type: {type(port_env)})")
+        
+        # Check all environment variables that might be relevant
+        relevant_vars = ['PORT', 'FLASK_DEBUG', 'SCRAPER_MODE', 'RAILWAY_CRON_SCHEDULE']
+        for var in relevant_vars:
+            value = os.environ.get(var)
+            logger.info(f"🔍 DEBUG: {var} = '{value}'")
+        
+        # Check if this is being run as cron vs standalone
+        if 'cron' in ' '.join(sys.argv).lower() or os.environ.get('RAILWAY_CRON_SCHEDULE'):
+            logger.info("🔍 DEBUG: Detected cron execution context")
+        else:
+            logger.info("🔍 DEBUG: Detected standalone execution context")
     
+    pending = []
     try:
         config = Config()
         storage = SupabaseStorage(config)
         
         # Get today's date
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = started_at.strftime("%Y-%m-%d")
         
         scrapers = [
             ("HSE", scrape_hse),
@@ -54,28 +69,58 @@ def main():
             ("MEPhI", scrape_mephi)
         ]
         
-        total_results = 0
+        # Run all scrapers concurrently (they are network-bound) and save
+        # the collected results in one request
+        all_results = []
+        pool = ThreadPoolExecutor(max_workers=len(scrapers))
+        futures = {}
         for scraper_name, scraper_func in scrapers:
-            print(f"Running {scraper_name} scraper...")
-            try:
-                results = scraper_func(config)
-                for result in results:
-                    result["date"] = today
-                storage.save_results(results)
-                total_results += len(results)
-                print(f"✅ {scraper_name}: Saved {len(results)} results")
-            except Exception as e:
-                print(f"❌ {scraper_name} failed: {e}")
-                import traceback
-                traceback.print_exc()
+            logger.info(f"Running {scraper_name} scraper...")
+            futures[pool.submit(scraper_func, config)] = scraper_name
+        
+        try:
+            for future in as_completed(futures, timeout=SCRAPERS_TIMEOUT):
+                scraper_name = futures[future]
+                try:
+                    results = future.result()
+                    for result in results:
+                        result["date"] = today
+                    all_results.extend(results)
+                    logger.info(f"✅ {scraper_name}: Collected {len(results)} results")
+                except Exception as e:
+                    logger.exception(f"❌ {scraper_name} failed: {e}")
+        except FuturesTimeoutError:
+            pending = [name for future, name in futures.items() if not future.done()]
+            logger.error(f"❌ Scrapers timed out after {SCRAPERS_TIMEOUT}s: {', '.join(pending)}")
+        finally:
+            pool.shutdown(wait=False)
+        
+        if all_results:
+            storage.save_results(all_results)
+        
+        if pending:
+            logger.error(f"❌ Abandoning hung scrapers after saving {len(all_results)} results")
+            exit_now(1)
         
-        print(f"✅ Cron scraper run completed successfully. Total results: {total_results}")
+        logger.info(f"✅ Cron scraper run completed successfully. Total results: {len(all_results)}")
         
     except Exception as e:
-        print(f"❌ Critical error in cron job: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Critical error in cron job: {e}")
+        if pending:
+            exit_now(1)
         sys.exit(1)
 
+
+def exit_now(code):
+    """
+    Exit immediately, without joining scraper threads.
+    
+    ThreadPoolExecutor workers are joined at interpreter exit, so a scraper
+    hung past SCRAPERS_TIMEOUT would otherwise keep the cron process alive.
+    """
+    logging.shutdown()
+    os._exit(code)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
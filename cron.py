@@ -6,9 +6,63 @@ This script is executed on a schedule defined by RAILWAY_CRON_SCHEDULE.
 
 import os
 import sys
-import subprocess
+import signal
+import multiprocessing
 from datetime import datetime
 
+CRON_TIMEOUT = 600  # 10 minute timeout
+
+
+def run_scrapers():
+    """Run all scrapers and save results (executed in the child process)."""
+    # Lead our own process group so a timeout can kill every descendant
+    os.setsid()
+    
+    # Set clean environment to prevent any Flask/PORT conflicts
+    os.environ.pop('PORT', None)
+    # Ensure we're in scraper mode
+    os.environ['SCRAPER_MODE'] = 'enabled'
+    
+    # Import scrapers here so the parent process never loads them
+    from scrapers.hse import scrape_hse
+    from scrapers.mipt import scrape_mipt
+    from scrapers.mephi import scrape_mephi
+    from storage.supabase_client import SupabaseStorage
+    from config import Config
+    
+    print("🚀 Starting cron scraper run...")
+    
+    config = Config()
+    storage = SupabaseStorage(config)
+    
+    # Get today's date
+    today = datetime.now().strftime("%Y-%m-%d")
+    
+    scrapers = [
+        ("HSE", scrape_hse),
+        ("MIPT", scrape_mipt), 
+        ("MEPhI", scrape_mephi)
+    ]
+    
+    # Collect results from all scrapers and save them in one request
+    all_results = []
+    for scraper_name, scraper_func in scrapers:
+        print(f"Running {scraper_name} scraper...")
+        try:
+            results = scraper_func(config)
+            for result in results:
+                result["date"] = today
+            all_results.extend(results)
+            print(f"✅ {scraper_name}: Collected {len(results)} results")
+        except Exception as e:
+            print(f"❌ {scraper_name} failed: {e}")
+    
+    if all_results:
+        storage.save_results(all_results)
+    
+    print(f"✅ Cron scraper run completed. Total results: {len(all_results)}")
+
+
 def main():
     """Run the scraper job."""
     print(f"🚀 Starting Edu Parser Cron Job at {datetime.now()}")
@@ -34,77 +88,33 @@ def main():
         value = os.environ.get(var)
         print(f"🔍 DEBUG: {var} = '{value}'")
     
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    
     try:
-        # Set clean environment to prevent any Flask/PORT conflicts
-        env = os.environ.copy()
-        env['PYTHONPATH'] = os.path.dirname(os.path.abspath(__file__))
-        # Remove PORT to prevent Flask from trying to start
-        env.pop('PORT', None)
-        # Ensure we're in scraper mode
-        env['SCRAPER_MODE'] = 'enabled'
-        
-        # Run scraper directly without importing main.py or dashboard
-        result = subprocess.run([
-            sys.executable, '-c', '''
-import sys
-import os
-sys.path.insert(0, os.getcwd())
-
-from scrapers.hse import scrape_hse
-from scrapers.mipt import scrape_mipt
-from scrapers.mephi import scrape_mephi
-from storage.supabase_client import SupabaseStorage
-from config import Config
-from datetime import datetime
-
-print("🚀 Starting cron scraper run...")
-
-config = Config()
-storage = SupabaseStorage(config)
-
-# Get today's date
-today = datetime.now().strftime("%Y-%m-%d")
-
-scrapers = [
-    ("HSE", scrape_hse),
-    ("MIPT", scrape_mipt), 
-    ("MEPhI", scrape_mephi)
-]
-
-for scraper_name, scraper_func in scrapers:
-    print(f"Running {scraper_name} scraper...")
-    try:
-        results = scraper_func(config)
-        for result in results:
-            result["date"] = today
-        storage.save_results(results)
-        print(f"✅ {scraper_name}: Saved {len(results)} results")
-    except Exception as e:
-        print(f"❌ {scraper_name} failed: {e}")
-
-print("✅ Cron scraper run completed")
-'''
-        ], 
-        cwd=os.path.dirname(os.path.abspath(__file__)),
-        env=env,
-        capture_output=True,
-        text=True,
-        timeout=600  # 10 minute timeout
-        )
+        # Run scrapers in a forked child: keeps the isolation of a separate
+        # process without paying for a second interpreter startup
+        ctx = multiprocessing.get_context('fork')
+        process = ctx.Process(target=run_scrapers, name='edu-parser-scrapers')
+        process.start()
+        process.join(timeout=CRON_TIMEOUT)
         
-        print("STDOUT:", result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
+        if process.is_alive():
+            # terminate() would only signal the child; kill the whole group
+            # so grandchildren (browsers, helper processes) don't outlive it
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            process.join()
+            print(f"❌ Cron job timed out after 10 minutes")
+            sys.exit(1)
         
-        if result.returncode == 0:
+        if process.exitcode == 0:
             print(f"✅ Cron job completed successfully at {datetime.now()}")
         else:
-            print(f"❌ Cron job failed with return code {result.returncode}")
+            print(f"❌ Cron job failed with return code {process.exitcode}")
             sys.exit(1)
         
-    except subprocess.TimeoutExpired:
-        print(f"❌ Cron job timed out after 10 minutes")
-        sys.exit(1)
     except Exception as e:
         print(f"❌ Cron job failed: {e}")
         import traceback
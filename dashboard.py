@@ -8,18 +8,28 @@ Provides a web interface to view scraping results and system health status.
 import os
 import sys
 import csv
+import fcntl
+import hashlib
 import io
+import signal
+import subprocess
+import tempfile
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 
-from flask import Flask, render_template, jsonify, request, abort, make_response
+from flask import Flask, Response, render_template, jsonify, request, abort, make_response, g
 from functools import wraps
+from operator import itemgetter
+from werkzeug.middleware.proxy_fix import ProxyFix
 from dotenv import load_dotenv
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from core.storage import Storage
+from core.dashboard_data import MONTHS_RU, load_dashboard_payload, university_for
 from core.logging_config import setup_logging, get_logger
 
 # Load environment variables
@@ -34,28 +44,80 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')
 app.config['JSON_SORT_KEYS'] = False
 
+# Railway terminates requests at one proxy hop; trust its X-Forwarded-For
+app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1)
 
-def check_access():
-    """Check if access is allowed based on IP restrictions."""
-    # If no restrictions are set, allow all
-    allowed_ips = os.environ.get('DASHBOARD_ALLOWED_IPS', '')
-    if not allowed_ips:
-        return True
-    
-    # Get client IP
-    client_ip = request.headers.get('X-Forwarded-For', request.remote_addr)
-    if ',' in client_ip:
-        # Take the first IP if there are multiple (proxy chain)
-        client_ip = client_ip.split(',')[0].strip()
-    
-    # Check if client IP is in allowed list
-    allowed_list = [ip.strip() for ip in allowed_ips.split(',')]
+# Dashboard IP allow-list (unset means no restrictions); localhost is
+# always allowed for development
+_ALLOWED_IPS_RAW = os.environ.get('DASHBOARD_ALLOWED_IPS', '')
+_ALLOW_ALL = not _ALLOWED_IPS_RAW
+_ALLOWED_IPS = frozenset(ip.strip() for ip in _ALLOWED_IPS_RAW.split(',') if ip.strip()) | {'127.0.0.1', '::1', 'localhost'}
+
+# Version is fixed at deploy time, read it once
+try:
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'VERSION'), 'r') as f:
+        VERSION = f.read().strip()
+except OSError:
+    VERSION = 'unknown'
+
+# Shared Storage instance, created on first use (the Supabase client is thread-safe)
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_storage() -> Storage:
+    """Return the process-wide Storage instance, creating it on first call."""
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                _storage = Storage()
+    return _storage
+
+
+# Process-local cache of read-only responses; applicant_counts changes only
+# when scrapers run. key -> (expires_at, value)
+_response_cache = {}
+_response_cache_lock = threading.Lock()
+# One build lock per key, so a slow build only blocks callers of that key
+_response_build_locks = {}
+
+
+def cached(key, ttl: float, build):
+    """
+    Return the cached value for key, calling build() on a miss or expiry.
     
-    # Special case for localhost/development
-    if client_ip in ['127.0.0.1', '::1', 'localhost']:
-        return True
+    Builds run under a per-key lock, so concurrent misses for the same key
+    share one upstream call while other keys are served independently.
+    """
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        build_lock = _response_build_locks.setdefault(key, threading.Lock())
     
-    return client_ip in allowed_list
+    with build_lock:
+        # Another thread may have rebuilt it while we waited
+        with _response_cache_lock:
+            entry = _response_cache.get(key)
+        now = time.monotonic()
+        if entry is None or entry[0] <= now:
+            entry = (now + ttl, build())
+            with _response_cache_lock:
+                _response_cache[key] = entry
+        return entry[1]
+
+
+def clear_response_cache():
+    """Drop all cached responses (after new data is written)."""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
+def check_access():
+    """Check if access is allowed based on IP restrictions."""
+    # Client IP is resolved from X-Forwarded-For by ProxyFix
+    return _ALLOW_ALL or request.remote_addr in _ALLOWED_IPS
 
 
 def require_access(f):
@@ -69,168 +131,72 @@ def require_access(f):
     return decorated_function
 
 
+@app.before_request
+def set_request_time():
+    """Take the request timestamp once for all handlers."""
+    g.now = datetime.now()
+    g.today = g.now.date()
+
+
+# Cache-Control per endpoint; the JSON APIs change at most a few times a day
+_CACHE_CONTROL = {
+    'api_stats': 'private, max-age=300',
+    'api_scrapers': 'private, max-age=3600',
+    'health': 'no-store',
+}
+
+
+@app.after_request
+def add_cache_headers(response):
+    """Set Cache-Control and ETag headers on cacheable endpoints."""
+    cache_control = _CACHE_CONTROL.get(request.endpoint)
+    if cache_control is None:
+        return response
+    
+    response.headers['Cache-Control'] = cache_control
+    if cache_control != 'no-store' and request.method == 'GET' and response.status_code == 200:
+        response.add_etag()
+        response.make_conditional(request)
+    return response
+
+
 @app.route('/')
 @require_access
 def dashboard():
     """Main dashboard view showing data like Google Sheets with 7-day columns."""
     try:
-        storage = Storage()
-        
-        # Get all available dates (not just last 7)
-        recent_dates_result = storage.client.table('applicant_counts')\
-            .select('date')\
-            .eq('status', 'success')\
-            .order('date', desc=True)\
-            .execute()
-        
-        # Get unique dates and limit to last 7 for display
-        all_unique_dates = sorted(list(set(r['date'] for r in recent_dates_result.data)), reverse=True)
-        unique_dates = all_unique_dates[:7]  # Limit to 7 most recent dates for display
-        
-        if not unique_dates:
-            # No data available
-            return render_template('dashboard.html',
-                date=datetime.now().date(),
-                total=0,
-                success=0,
-                errors=0,
-                success_rate=0,
-                programs_data={},
-                date_columns=[],
-                recent_dates=[]
-            )
-        
-        # Get data for all recent dates
-        start_date = unique_dates[-1] if unique_dates else datetime.now().date().isoformat()
-        end_date = unique_dates[0] if unique_dates else datetime.now().date().isoformat()
-        
-        all_results = storage.client.table('applicant_counts')\
-            .select('*')\
-            .gte('date', start_date)\
-            .lte('date', end_date)\
-            .eq('status', 'success')\
-            .order('name')\
-            .execute()
-        
-        # Calculate statistics for today (most recent date)
-        today_date = unique_dates[0] if unique_dates else datetime.now().date().isoformat()
-        today_results = [r for r in all_results.data if r['date'] == today_date]
+        storage = get_storage()
         
-        total = len(today_results)
-        success = len(today_results)  # We only get successful results
-        errors = 0  # We'll calculate this separately if needed
-        success_rate = 100 if total > 0 else 0
+        # Precomputed by the scraper run (see core/dashboard_data.py)
+        payload = dict(cached('dashboard', 120, lambda: load_dashboard_payload(storage)))
         
-        # Organize data by program (like Google Sheets)
-        programs_data = {}
-        
-        for result in all_results.data:
-            # Determine university from scraper_id
-            scraper_id = result['scraper_id']
-            if scraper_id.startswith('hse_'):
-                university = 'НИУ ВШЭ'
-            elif scraper_id.startswith('mipt_'):
-                university = 'МФТИ'
-            elif scraper_id.startswith('mephi_'):
-                university = 'МИФИ'
-            else:
-                university = 'Unknown'
-            
-            program_name = result.get('name', result['scraper_id'])
-            
-            # Clean program name
-            if program_name.startswith('HSE - '):
-                program_name = program_name[6:]
-            elif program_name.startswith('МФТИ - '):
-                program_name = program_name[7:]
-            elif program_name.startswith('НИЯУ МИФИ - '):
-                program_name = program_name[12:]
-            
-            program_key = f"{university} - {program_name}"
-            
-            if program_key not in programs_data:
-                programs_data[program_key] = {
-                    'university': university,
-                    'program': program_name,
-                    'counts_by_date': {}
-                }
-            
-            programs_data[program_key]['counts_by_date'][result['date']] = result.get('count', 0)
+        # Unchanged payload since the client's last visit: skip rendering
+        etag = hashlib.md5(f"{payload['date']}:{payload.get('generated_at', '')}".encode()).hexdigest()
+        if request.if_none_match.contains(etag):
+            response = make_response('', 304)
+        else:
+            payload['date'] = datetime.strptime(payload['date'], '%Y-%m-%d').date() if payload['date'] else g.today
+            response = make_response(render_template('dashboard.html', **payload))
         
-        # Format date columns for display
-        date_columns = []
-        for date_str in unique_dates:
-            try:
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                months = ['янв', 'фев', 'мар', 'апр', 'май', 'июн',
-                         'июл', 'авг', 'сен', 'окт', 'ноя', 'дек']
-                formatted_date = f"{date_obj.day} {months[date_obj.month - 1]}"
-                date_columns.append({
-                    'date': date_str,
-                    'formatted': formatted_date
-                })
-            except ValueError:
-                date_columns.append({
-                    'date': date_str,
-                    'formatted': date_str
-                })
-        
-        # Calculate growth percentages for each program (earliest to latest)
-        for program_key, program_data in programs_data.items():
-            counts = program_data['counts_by_date']
-            
-            # Get all dates with data for this program, sorted chronologically
-            program_dates = [d for d in unique_dates if d in counts and counts[d] is not None]
-            program_dates.sort()  # Sort chronologically (earliest first)
-            
-            if len(program_dates) >= 2:
-                # Compare earliest vs latest available dates
-                earliest_count = counts[program_dates[0]]   # First (earliest) date
-                latest_count = counts[program_dates[-1]]    # Last (latest) date
-                
-                if earliest_count and earliest_count > 0:
-                    growth = ((latest_count - earliest_count) / earliest_count) * 100
-                    program_data['growth_percentage'] = round(growth, 1)
-                    
-                    # Store info about date range for debugging
-                    program_data['growth_period'] = {
-                        'from_date': program_dates[0],
-                        'to_date': program_dates[-1],
-                        'from_count': earliest_count,
-                        'to_count': latest_count
-                    }
-                else:
-                    program_data['growth_percentage'] = None
-            else:
-                program_data['growth_percentage'] = None
-        
-        return render_template('dashboard.html',
-            date=datetime.strptime(today_date, '%Y-%m-%d').date() if unique_dates else datetime.now().date(),
-            total=total,
-            success=success,
-            errors=errors,
-            success_rate=success_rate,
-            programs_data=programs_data,
-            date_columns=date_columns,
-            recent_dates=unique_dates
-        )
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, max-age=60'
+        return response
         
     except Exception as e:
         logger.error(f"Dashboard error: {e}")
         return render_template('error.html', error=str(e)), 500
 
 
-@app.route('/health')
-def health():
-    """Health check endpoint for monitoring."""
+def _check_health():
+    """Run the upstream health checks and return (payload, status code)."""
     try:
-        storage = Storage()
+        storage = get_storage()
         
         # Check if we have recent data (within last 48 hours)
-        cutoff_date = (datetime.now() - timedelta(days=2)).date()
+        cutoff_date = (g.now - timedelta(days=2)).date()
         
         result = storage.client.table('applicant_counts')\
-            .select('date, status')\
+            .select('date')\
             .gte('date', cutoff_date.isoformat())\
             .order('date', desc=True)\
             .limit(1)\
@@ -247,36 +213,37 @@ def health():
             except:
                 db_healthy = False
             
-            # Read version info
-            try:
-                with open('VERSION', 'r') as f:
-                    version = f.read().strip()
-            except:
-                version = 'unknown'
-            
-            return jsonify({
+            return {
                 'status': 'healthy' if db_healthy else 'degraded',
-                'version': version,
+                'version': VERSION,
                 'last_run': last_run,
                 'database': 'connected' if db_healthy else 'error',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': g.now.isoformat(),
                 'cache_buster': os.environ.get('CACHE_BUSTER', 'none'),
                 'git_commit': os.environ.get('RAILWAY_GIT_COMMIT_SHA', 'unknown')[:8] if os.environ.get('RAILWAY_GIT_COMMIT_SHA') else 'unknown'
-            })
+            }, 200
         else:
-            return jsonify({
+            return {
                 'status': 'unhealthy',
                 'error': 'No recent data found',
-                'timestamp': datetime.now().isoformat()
-            }), 503
+                'timestamp': g.now.isoformat()
+            }, 503
             
     except Exception as e:
         logger.error(f"Health check error: {e}")
-        return jsonify({
+        return {
             'status': 'unhealthy',
             'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 503
+            'timestamp': g.now.isoformat()
+        }, 503
+
+
+@app.route('/health')
+def health():
+    """Health check endpoint for monitoring."""
+    # Shared for a few seconds so bursts of monitor probes hit Supabase once
+    payload, status = cached('health', 15, _check_health)
+    return jsonify(payload), status
 
 
 @app.route('/api/stats')
@@ -284,46 +251,24 @@ def health():
 def api_stats():
     """API endpoint for getting statistics."""
     try:
-        storage = Storage()
+        storage = get_storage()
         
         # Get statistics for the last 7 days
-        end_date = datetime.now().date()
+        end_date = g.today
         start_date = end_date - timedelta(days=6)
         
-        results = storage.client.table('applicant_counts')\
-            .select('date, status, count')\
-            .gte('date', start_date.isoformat())\
-            .lte('date', end_date.isoformat())\
-            .execute()
-        
-        # Aggregate by date
-        stats_by_date = {}
-        for result in results.data:
-            date = result['date']
-            if date not in stats_by_date:
-                stats_by_date[date] = {
-                    'total': 0,
-                    'success': 0,
-                    'error': 0,
-                    'total_applicants': 0
-                }
+        def fetch_stats():
+            # Aggregated per day in Postgres (see stats_by_date in sql/create_tables.sql)
+            results = storage.client.rpc('stats_by_date', {
+                'start_date': start_date.isoformat(),
+                'end_date': end_date.isoformat()
+            }).execute()
             
-            stats_by_date[date]['total'] += 1
-            if result['status'] == 'success':
-                stats_by_date[date]['success'] += 1
-                if result['count']:
-                    stats_by_date[date]['total_applicants'] += result['count']
-            else:
-                stats_by_date[date]['error'] += 1
-        
-        # Convert to list and sort by date
-        stats_list = []
-        for date, stats in stats_by_date.items():
-            stats['date'] = date
-            stats['success_rate'] = (stats['success'] / stats['total'] * 100) if stats['total'] > 0 else 0
-            stats_list.append(stats)
-        
-        stats_list.sort(key=lambda x: x['date'])
+            for stats in results.data:
+                stats['success_rate'] = (stats['success'] / stats['total'] * 100) if stats['total'] > 0 else 0
+            return results.data
+        
+        stats_list = cached(('api_stats', start_date, end_date), 300, fetch_stats)
         
         return jsonify({
             'stats': stats_list,
@@ -343,17 +288,21 @@ def api_stats():
 def api_scrapers():
     """API endpoint for getting scraper configuration."""
     try:
-        storage = Storage()
+        storage = get_storage()
         
-        scrapers = storage.client.table('scrapers_config')\
-            .select('*')\
-            .order('name')\
-            .execute()
+        def fetch_scrapers():
+            return storage.client.table('scrapers_config')\
+                .select('*')\
+                .order('name')\
+                .execute()\
+                .data
+        
+        scrapers = cached('api_scrapers', 300, fetch_scrapers)
         
         return jsonify({
-            'scrapers': scrapers.data,
-            'total': len(scrapers.data),
-            'enabled': sum(1 for s in scrapers.data if s.get('enabled', False))
+            'scrapers': scrapers,
+            'total': len(scrapers),
+            'enabled': sum(1 for s in scrapers if s.get('enabled', False))
         })
         
     except Exception as e:
@@ -363,54 +312,103 @@ def api_scrapers():
 
 
 
+class _JobLock:
+    """
+    Non-blocking job lock shared by all gunicorn workers on this host.
+    
+    Backed by flock() on a file in the temp dir, so a second POST landing on
+    another worker sees the job as running, and the lock is dropped by the
+    kernel if the worker holding it dies.
+    """
+    
+    def __init__(self, name: str):
+        self.path = os.path.join(tempfile.gettempdir(), f'edu-parser-{name}.lock')
+        self._fd = None
+    
+    def acquire(self, blocking: bool = True) -> bool:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+    
+    def release(self):
+        fd, self._fd = self._fd, None
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+# Held while a manual scraper run / Google Sheets sync is in progress
+_scrape_lock = _JobLock('scrapers')
+_sheets_lock = _JobLock('sheets-sync')
+
+
+def _run_script(script: str, *args: str, timeout: float) -> int:
+    """
+    Run a project script in its own process group, streaming its output to the log.
+    
+    A timer kills the whole group after `timeout` seconds; reading the merged
+    stdout/stderr pipe line by line keeps a chatty child from blocking on a
+    full pipe buffer.
+    
+    Returns:
+        The child's return code (-SIGKILL if it was killed on timeout)
+    """
+    proc = subprocess.Popen(
+        [sys.executable, script, *args],
+        cwd=os.getcwd(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        start_new_session=True
+    )
+    
+    def kill_group():
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    
+    timer = threading.Timer(timeout, kill_group)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            logger.info(f"[{script}] {line.rstrip()}")
+        return proc.wait()
+    finally:
+        timer.cancel()
+
+
 @app.route('/api/run-all-scrapers', methods=['POST'])
 @require_access
 def run_all_scrapers():
     """Run all scrapers manually and overwrite today's data."""
     try:
-        import threading
-        from datetime import date
         # Import main lazily to avoid startup issues
 # from main import main as run_scrapers
         
         def run_scrapers_background():
             try:
-                # First, delete today's data
-                today = date.today().isoformat()
-                storage = Storage()
-                
-                # Delete existing records for today
-                existing = storage.client.table('applicant_counts')\
-                    .select('id')\
-                    .eq('date', today)\
-                    .execute()
-                
-                if existing.data:
-                    ids_to_delete = [record['id'] for record in existing.data]
-                    storage.client.table('applicant_counts')\
-                        .delete()\
-                        .in_('id', ids_to_delete)\
-                        .execute()
-                    logger.info(f"Deleted {len(ids_to_delete)} existing records for {today}")
+                # Today's rows are overwritten in place: results are upserted on
+                # (scraper_id, date) and rows whose values did not change are
+                # skipped, so there is nothing to delete first
                 
                 # Run scrapers using subprocess to avoid signal issues
                 logger.info("Starting manual scraper run via subprocess")
-                import subprocess
-                import os
+                returncode = _run_script('main.py', timeout=600)  # 10 minute timeout
                 
-                # Use subprocess to run scrapers in separate process
-                # Use sys.executable to get the correct Python path
-                import sys
-                result = subprocess.run([
-                    sys.executable, 'main.py'
-                ], cwd=os.getcwd(), capture_output=True, text=True, timeout=600)  # 10 minute timeout
+                clear_response_cache()
                 
-                if result.returncode == 0:
+                if returncode == 0:
                     logger.info("Manual scraper run completed successfully")
+                elif returncode == -signal.SIGKILL:
+                    logger.error("Scraper run killed after 10 minute timeout")
                 else:
-                    logger.error(f"Scraper run failed with code {result.returncode}")
-                    logger.error(f"STDOUT: {result.stdout}")
-                    logger.error(f"STDERR: {result.stderr}")
+                    logger.error(f"Scraper run failed with code {returncode}")
                 
                 # Auto-cleanup any duplicates that might have been created
                 logger.info("Cleaning up any duplicate records")
@@ -434,15 +432,26 @@ def run_all_scrapers():
                     logger.error(f"Dynamic Google Sheets update error: {e}")
                     # Don't fail the manual run if sheets sync fails
                 
-            except subprocess.TimeoutExpired:
-                logger.error("Scraper run timed out after 10 minutes")
             except Exception as e:
                 logger.error(f"Error in manual scraper run: {e}")
+            finally:
+                _scrape_lock.release()
+        
+        # Only one manual run at a time (across all workers)
+        if not _scrape_lock.acquire(blocking=False):
+            return jsonify({
+                'status': 'already_running',
+                'error': 'Scrapers are already running'
+            }), 409
         
         # Run in background
         thread = threading.Thread(target=run_scrapers_background)
         thread.daemon = True
-        thread.start()
+        try:
+            thread.start()
+        except Exception:
+            _scrape_lock.release()
+            raise
         
         return jsonify({
             'status': 'started',
@@ -459,7 +468,7 @@ def run_all_scrapers():
 def export_csv():
     """Export applicant data as CSV file."""
     try:
-        storage = Storage()
+        storage = get_storage()
         
         # Get date range (last 7 days by default, or specific date from query)
         date_param = request.args.get('date')
@@ -469,7 +478,7 @@ def export_csv():
             date_filter = target_date
         else:
             # Export last 7 days
-            end_date = datetime.now().date()
+            end_date = g.today
             start_date = end_date - timedelta(days=6)
             date_filter = None
         
@@ -477,14 +486,16 @@ def export_csv():
         if date_filter:
             # Single date
             result = storage.client.table('applicant_counts')\
-                .select('*')\
+                .select('scraper_id, name, date, count')\
+                .eq('status', 'success')\
                 .eq('date', date_filter)\
                 .order('name')\
                 .execute()
         else:
             # Date range
             result = storage.client.table('applicant_counts')\
-                .select('*')\
+                .select('scraper_id, name, date, count')\
+                .eq('status', 'success')\
                 .gte('date', start_date.isoformat())\
                 .lte('date', end_date.isoformat())\
                 .order('name')\
@@ -498,85 +509,76 @@ def export_csv():
         dates = set()
         
         for record in result.data:
-            if record['status'] != 'success' or not record['count']:
+            if not record['count']:
                 continue
-                
+            
             # Determine university from scraper_id or name
             scraper_id = record['scraper_id']
             name = record.get('name', scraper_id)
             
-            if scraper_id.startswith('hse_'):
-                university = 'НИУ ВШЭ'
-            elif scraper_id.startswith('mipt_'):
-                university = 'МФТИ'
-            elif scraper_id.startswith('mephi_'):
-                university = 'МИФИ'
-            else:
-                university = record.get('university', 'Unknown')
+            university = university_for(scraper_id, record.get('university', 'Unknown'))
             
             program_key = f"{university} - {name}"
             date_str = record['date']
             dates.add(date_str)
             
-            if program_key not in programs_data:
-                programs_data[program_key] = {
+            program_data = programs_data.get(program_key)
+            if program_data is None:
+                program_data = programs_data[program_key] = {
                     'university': university,
                     'program': name,
                     'url': '',  # We don't store URLs in applicant_counts table
                     'counts_by_date': {}
                 }
             
-            programs_data[program_key]['counts_by_date'][date_str] = record['count']
+            program_data['counts_by_date'][date_str] = record['count']
         
         # Sort dates
-        sorted_dates = sorted(list(dates))
-        
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.writer(output)
+        sorted_dates = sorted(dates)
         
         # Write header
         header = ['вуз', 'программа']
         for date_str in sorted_dates:
             # Format date as "DD месяц"
             date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-            months = ['янв', 'фев', 'мар', 'апр', 'май', 'июн',
-                     'июл', 'авг', 'сен', 'окт', 'ноя', 'дек']
-            formatted_date = f"{date_obj.day} {months[date_obj.month - 1]}"
+            formatted_date = f"{date_obj.day} {MONTHS_RU[date_obj.month - 1]}"
             header.append(formatted_date)
         
         if len(header) > 2:  # Only write if we have date columns
             header.append('URL')  # Add URL column at the end
         
-        writer.writerow(header)
-        
-        # Write data rows
-        for program_key in sorted(programs_data.keys()):
-            program_data = programs_data[program_key]
-            row = [
-                program_data['university'],
-                program_data['program']
-            ]
+        def generate():
+            """Yield the CSV one row at a time."""
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
             
-            # Add counts for each date
-            for date_str in sorted_dates:
-                count = program_data['counts_by_date'].get(date_str, '')
-                row.append(count)
+            def flush():
+                data = buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                return data
             
-            # Add URL (empty for now, could be enhanced later)
-            if len(header) > 2:
-                row.append('')
+            writer.writerow(header)
+            yield flush()
             
-            writer.writerow(row)
-        
-        # Prepare response
-        output.seek(0)
-        csv_data = output.getvalue()
-        output.close()
-        
-        # Create response with proper headers
-        response = make_response(csv_data)
-        response.headers['Content-Type'] = 'text/csv; charset=utf-8'
+            # Write data rows sorted by university, then cleaned program name
+            for program_data in sorted(programs_data.values(), key=itemgetter('university', 'program')):
+                row = [
+                    program_data['university'],
+                    program_data['program']
+                ]
+                
+                # Add counts for each date
+                for date_str in sorted_dates:
+                    count = program_data['counts_by_date'].get(date_str, '')
+                    row.append(count)
+                
+                # Add URL (empty for now, could be enhanced later)
+                if len(header) > 2:
+                    row.append('')
+                
+                writer.writerow(row)
+                yield flush()
         
         # Generate filename
         if date_filter:
@@ -584,6 +586,9 @@ def export_csv():
         else:
             filename = f"applicant_data_{start_date}_to_{end_date}.csv"
         
+        # Stream the rows instead of building the whole file in memory
+        response = Response(generate(), mimetype='text/csv')
+        response.headers['Content-Type'] = 'text/csv; charset=utf-8'
         response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
         
         logger.info(f"CSV export completed: {len(programs_data)} programs, {len(sorted_dates)} dates")
@@ -599,7 +604,6 @@ def export_csv():
 def sync_to_sheets():
     """Manually sync data to Google Sheets."""
     try:
-        import threading
         from datetime import date
         
         # Get date parameter in main thread (before background execution)
@@ -621,11 +625,23 @@ def sync_to_sheets():
                 
             except Exception as e:
                 logger.error(f"Error in manual Google Sheets sync: {e}")
+            finally:
+                _sheets_lock.release()
+        
+        if not _sheets_lock.acquire(blocking=False):
+            return jsonify({
+                'status': 'already_running',
+                'error': 'Google Sheets sync is already running'
+            }), 409
         
         # Run sync in background
         thread = threading.Thread(target=sync_background)
         thread.daemon = True
-        thread.start()
+        try:
+            thread.start()
+        except Exception:
+            _sheets_lock.release()
+            raise
         
         return jsonify({
             'status': 'started',
@@ -642,8 +658,6 @@ def sync_to_sheets():
 def sync_specific_date():
     """Sync a specific date to Google Sheets."""
     try:
-        import threading
-        
         # Get date parameter from request
         request_data = request.json if request.json else {}
         target_date = request_data.get('date')
@@ -663,7 +677,7 @@ def sync_specific_date():
                 logger.info(f"Starting specific date sync for {target_date}")
                 
                 # Check if we have data for this date
-                storage = Storage()
+                storage = get_storage()
                 result = storage.client.table('applicant_counts')\
                     .select('count()')\
                     .eq('date', target_date)\
@@ -686,11 +700,23 @@ def sync_specific_date():
                 
             except Exception as e:
                 logger.error(f"Error in specific date sync for {target_date}: {e}")
+            finally:
+                _sheets_lock.release()
+        
+        if not _sheets_lock.acquire(blocking=False):
+            return jsonify({
+                'status': 'already_running',
+                'error': 'Google Sheets sync is already running'
+            }), 409
         
         # Run sync in background
         thread = threading.Thread(target=sync_background)
         thread.daemon = True
-        thread.start()
+        try:
+            thread.start()
+        except Exception:
+            _sheets_lock.release()
+            raise
         
         return jsonify({
             'status': 'started',
@@ -711,7 +737,7 @@ def debug_program():
         program_name = request.args.get('name', '').lower()
         scraper_id = request.args.get('scraper_id', '')
         
-        storage = Storage()
+        storage = get_storage()
         
         # Search for programs containing the name
         if program_name:
@@ -808,32 +834,24 @@ def fix_program_names():
 def verify_sync():
     """Verify Google Sheets sync for a specific date."""
     try:
-        import threading
-        import subprocess
-        import sys
-        
         # Get date parameter
         request_data = request.json if request.json else {}
-        target_date = request_data.get('date') or date.today().isoformat()
+        target_date = request_data.get('date') or g.today.isoformat()
         
         def verify_background():
             try:
                 logger.info(f"Starting Google Sheets sync verification for {target_date}")
                 
-                # Run verification script
-                result = subprocess.run([
-                    sys.executable, 'verify_sheets_sync.py', target_date
-                ], cwd=os.getcwd(), capture_output=True, text=True, timeout=120)
+                # Run verification script (details are streamed to the log)
+                returncode = _run_script('verify_sheets_sync.py', target_date, timeout=120)
                 
-                if result.returncode == 0:
+                if returncode == 0:
                     logger.info(f"✅ Google Sheets sync verification PASSED for {target_date}")
+                elif returncode == -signal.SIGKILL:
+                    logger.error("Google Sheets sync verification timed out")
                 else:
                     logger.warning(f"⚠️ Google Sheets sync verification FAILED for {target_date}")
-                    if result.stdout:
-                        logger.info(f"Verification details: {result.stdout}")
                 
-            except subprocess.TimeoutExpired:
-                logger.error("Google Sheets sync verification timed out")
             except Exception as e:
                 logger.error(f"Error in Google Sheets sync verification: {e}")
         
@@ -872,13 +890,7 @@ if __name__ == '__main__':
     logger.info(f"🔍 DEBUG: __file__ = {__file__}")
     logger.info(f"🔍 DEBUG: sys.argv = {sys.argv}")
     
-    # Read version info
-    try:
-        with open('VERSION', 'r') as f:
-            version = f.read().strip()
-        logger.info(f"🚀 DASHBOARD VERSION: {version}")
-    except:
-        logger.info("🚀 DASHBOARD VERSION: unknown")
+    logger.info(f"🚀 DASHBOARD VERSION: {VERSION}")
     
     # Log all environment variables related to WEB_PORT (renamed from PORT to avoid Railway conflicts)
     web_port_env = os.environ.get('WEB_PORT')
@@ -4,6 +4,7 @@
 """
 
 import os
+import re
 import sys
 from dotenv import load_dotenv
 
@@ -16,14 +17,34 @@ from scrapers.hse import download_hse_excel, APPLICATION_COUNT_COLUMNS, HSE_TARG
 setup_logging(log_level="DEBUG")
 logger = get_logger(__name__)
 
-def debug_hse_excel():
-    """Детальный анализ HSE Excel файла"""
+def categorical_contains(cats, pattern, **kwargs):
+    """Маска строк категориальной серии, где каждое уникальное значение проверяется один раз"""
+    categories = cats.cat.categories
+    return cats.isin(categories[categories.str.contains(pattern, na=False, **kwargs)])
+
+# Ключевые слова в названиях колонок: заявления и названия программ
+COUNT_COLUMN_PATTERN = '|'.join(('заявл', 'количество', 'кол'))
+PROGRAM_COLUMN_PATTERN = '|'.join(('программ', 'направл', 'специальн'))
+_NEEDED_COLUMNS_RE = re.compile(f'{COUNT_COLUMN_PATTERN}|{PROGRAM_COLUMN_PATTERN}')
+
+def debug_hse_excel(only_needed_columns=False):
+    """
+    Детальный анализ HSE Excel файла
+    
+    По умолчанию читаются все колонки, чтобы были видны переименованные.
+    only_needed_columns=True (флаг --only-needed-columns) разбирает только
+    колонки с заявлениями и программами - быстрее, но переименованные
+    колонки в вывод не попадут.
+    """
     print("🔍 ДЕТАЛЬНАЯ ОТЛАДКА HSE EXCEL")
     print("=" * 60)
     
     # Скачиваем Excel
     print("\n1️⃣ Скачиваем Excel файл...")
-    df = download_hse_excel()
+    usecols = None
+    if only_needed_columns:
+        usecols = lambda col: bool(_NEEDED_COLUMNS_RE.search(str(col).lower()))
+    df = download_hse_excel(usecols=usecols)
     
     if df is None:
         print("❌ Не удалось скачать Excel файл")
@@ -48,9 +69,8 @@ def debug_hse_excel():
     if not found_column:
         print("❌ Не найдена колонка с заявлениями")
         print("\nПопробуем найти похожие:")
-        for col in df.columns:
-            if any(word in col.lower() for word in ['заявл', 'количество', 'кол']):
-                print(f"   Похожая: '{col}'")
+        for col in df.columns[df.columns.str.lower().str.contains(COUNT_COLUMN_PATTERN)]:
+            print(f"   Похожая: '{col}'")
         return
     
     # Анализируем данные в колонке
@@ -63,28 +83,27 @@ def debug_hse_excel():
     
     # Показываем первые 10 значений
     print(f"\n   Первые 10 значений:")
-    for i, val in enumerate(app_count_data.head(10)):
+    for i, val in enumerate(app_count_data.head(10).to_numpy()):
         print(f"     {i}: '{val}' (тип: {type(val)})")
     
     # Ищем строки с программами
     print(f"\n5️⃣ Поиск целевых программ...")
     
     # Проверяем есть ли колонка с названиями программ
-    program_columns = []
-    for col in df.columns:
-        if any(word in col.lower() for word in ['программ', 'направл', 'специальн']):
-            program_columns.append(col)
+    program_columns = list(df.columns[df.columns.str.lower().str.contains(PROGRAM_COLUMN_PATTERN)])
     
     if program_columns:
         print(f"✅ Найдены колонки с программами: {program_columns}")
         
         for program_col in program_columns:
             print(f"\n   Анализ колонки '{program_col}':")
-            programs = df[program_col].dropna()
+            # Названия повторяются по строкам: категории позволяют проверять
+            # каждое уникальное название один раз
+            programs = df[program_col].dropna().astype('category')
             print(f"   Записей: {len(programs)}")
             
             # Показываем программы содержащие "ОНЛАЙН"
-            online_programs = programs[programs.str.contains('ОНЛАЙН', na=False, case=False)]
+            online_programs = programs[categorical_contains(programs, 'ОНЛАЙН', case=False)]
             print(f"   ОНЛАЙН программ: {len(online_programs)}")
             
             if len(online_programs) > 0:
@@ -92,15 +111,18 @@ def debug_hse_excel():
                 for i, prog in enumerate(online_programs.head(10)):
                     print(f"     {i}: '{prog}'")
             
-            # Проверяем наши целевые программы
+            # Проверяем наши целевые программы: один проход по колонке
+            # отбирает строки с любой из целевых, дальше ищем только в них
             print(f"\n   Проверка целевых программ:")
-            for target_prog in HSE_TARGET_PROGRAMS[:5]:  # Проверяем первые 5
-                matches = programs[programs.str.contains(target_prog, na=False, case=False)]
+            target_programs = HSE_TARGET_PROGRAMS[:5]  # Проверяем первые 5
+            targets_pattern = '|'.join(re.escape(t) for t in target_programs)
+            candidates = programs[categorical_contains(programs, targets_pattern, case=False)]
+            for target_prog in target_programs:
+                matches = candidates[categorical_contains(candidates, target_prog, case=False, regex=False)]
                 if len(matches) > 0:
                     print(f"     ✅ '{target_prog}': найдено {len(matches)} совпадений")
-                    # Показываем соответствующие значения заявлений
-                    for idx in matches.index:
-                        count_val = df.loc[idx, found_column]
+                    # Показываем соответствующие значения заявлений (одной выборкой)
+                    for count_val in df.loc[matches.index, found_column].to_numpy():
                         print(f"        Заявлений: '{count_val}'")
                 else:
                     print(f"     ❌ '{target_prog}': не найдено")
@@ -114,10 +136,11 @@ def debug_hse_excel():
     # Сохраняем Excel для анализа
     print(f"\n6️⃣ Сохранение Excel для ручного анализа...")
     try:
-        df.to_excel('debug_hse_data.xlsx', index=False)
-        print("✅ Данные сохранены в debug_hse_data.xlsx")
+        # CSV пишется C-движком pandas и открывается в Excel (utf-8-sig для кириллицы)
+        df.to_csv('debug_hse_data.csv', index=False, encoding='utf-8-sig')
+        print("✅ Данные сохранены в debug_hse_data.csv")
     except Exception as e:
         print(f"❌ Ошибка сохранения: {e}")
 
 if __name__ == "__main__":
-    debug_hse_excel()
\ No newline at end of file
+    debug_hse_excel(only_needed_columns='--only-needed-columns' in sys.argv[1:])
\ No newline at end of file
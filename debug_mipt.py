@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Run both MIPT debug scripts, fetching their pages concurrently."""
+
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.mipt import fetch_mipt_html_cached
+import debug_mipt_contemporary
+import debug_mipt_it_products
+
+DEBUGGERS = [
+    (debug_mipt_contemporary.URL, debug_mipt_contemporary.debug_contemporary_combinatorics),
+    (debug_mipt_it_products.URL, debug_mipt_it_products.debug_it_products),
+]
+
+def main():
+    # The fetches are network-bound, so run them side by side and parse afterwards
+    with ThreadPoolExecutor(max_workers=len(DEBUGGERS)) as pool:
+        pages = list(pool.map(fetch_mipt_html_cached, [url for url, _ in DEBUGGERS]))
+    
+    for (_, debug), html_content in zip(DEBUGGERS, pages):
+        debug(html_content or '')
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -5,37 +5,48 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from scrapers.mipt import fetch_mipt_html
-from bs4 import BeautifulSoup
+from scrapers.mipt import fetch_mipt_html_cached
+from lxml import html
 
-def debug_contemporary_combinatorics():
-    """Debug the Contemporary combinatorics page structure."""
+URL = "https://priem.mipt.ru/applications_v2/bWFzdGVyL0NvbnRlbXBvcmFyeSBTb21iaW5hdG9yaWNzX0tvbnRyYWt0Lmh0bWw="
+
+def debug_contemporary_combinatorics(html_content=None):
+    """Debug the Contemporary combinatorics page structure (fetches the page unless html_content is given)."""
     
-    url = "https://priem.mipt.ru/applications_v2/bWFzdGVyL0NvbnRlbXBvcmFyeSBTb21iaW5hdG9yaWNzX0tvbnRyYWt0Lmh0bWw="
+    url = URL
     
     print("🔍 DEBUGGING MIPT Contemporary combinatorics")
     print("=" * 50)
     print(f"URL: {url}")
     
     # Fetch HTML
-    html_content = fetch_mipt_html(url)
+    # DEBUG_CACHE=1 reuses the page from .cache/mipt/ for an hour
+    if html_content is None:
+        html_content = fetch_mipt_html_cached(url)
     if not html_content:
         print("❌ Failed to fetch HTML")
         return
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    tree = html.fromstring(html_content)
+    
+    # Check all table rows with different classes, bucketed in one walk
+    row_classes = ['R18', 'R11', 'R19', 'R0', 'R13']
+    rows_by_class = {row_class: [] for row_class in row_classes}
+    for tr in tree.iter('tr'):
+        for row_class in (tr.get('class') or '').split():
+            if row_class in rows_by_class:
+                rows_by_class[row_class].append(tr)
     
-    # Check all table rows with different classes
-    for row_class in ['R18', 'R11', 'R19', 'R0', 'R13']:
-        elements = soup.find_all('tr', class_=row_class)
+    for row_class in row_classes:
+        elements = rows_by_class[row_class]
         if elements:
             print(f"\n🎯 Found {len(elements)} rows with class '{row_class}':")
             
             # Show first few and last few elements
             for i, elem in enumerate(elements[:3]):  # First 3
-                cells = elem.find_all(['td', 'th'])
+                cells = elem.xpath('.//td|.//th')
                 if cells:
-                    cell_texts = [cell.get_text().strip() for cell in cells[:6]]  # First 6 columns
+                    cell_texts = [cell.text_content().strip() for cell in cells[:6]]  # First 6 columns
                     print(f"  Row {i+1}: {cell_texts}")
             
             if len(elements) > 6:
@@ -43,41 +54,41 @@ def debug_contemporary_combinatorics():
             
             # Last 3 elements
             for i, elem in enumerate(elements[-3:]):
-                cells = elem.find_all(['td', 'th'])
+                cells = elem.xpath('.//td|.//th')
                 if cells:
-                    cell_texts = [cell.get_text().strip() for cell in cells[:6]]  # First 6 columns
+                    cell_texts = [cell.text_content().strip() for cell in cells[:6]]  # First 6 columns
                     actual_index = len(elements) - 3 + i + 1
                     print(f"  Row {actual_index}: {cell_texts}")
     
     # Check if there's a table with data-index or other attributes
     print(f"\n🔍 Looking for data-index attributes:")
-    data_index_elements = soup.find_all(attrs={"data-index": True})
+    data_index_elements = tree.xpath('//*[@data-index]')
     if data_index_elements:
         print(f"Found {len(data_index_elements)} elements with data-index:")
         for elem in data_index_elements[-5:]:  # Last 5
-            print(f"  data-index='{elem.get('data-index')}' tag='{elem.name}' text='{elem.get_text().strip()[:50]}'")
+            print(f"  data-index='{elem.get('data-index')}' tag='{elem.tag}' text='{elem.text_content().strip()[:50]}'")
     else:
         print("  No data-index attributes found")
     
     # Look at the table structure
     print(f"\n📊 Table structure analysis:")
-    tables = soup.find_all('table')
+    tables = tree.xpath('//table')
     for i, table in enumerate(tables):
-        rows = table.find_all('tr')
+        rows = table.xpath('.//tr')
         print(f"  Table {i+1}: {len(rows)} rows")
         if rows:
             # Check header row
-            header_cells = rows[0].find_all(['th', 'td'])
+            header_cells = rows[0].xpath('.//th|.//td')
             if header_cells:
-                headers = [cell.get_text().strip() for cell in header_cells]
+                headers = [cell.text_content().strip() for cell in header_cells]
                 print(f"    Headers: {headers[:6]}")  # First 6 headers
             
             # Check last data row
             if len(rows) > 1:
                 last_row = rows[-1]
-                cells = last_row.find_all(['td', 'th'])
+                cells = last_row.xpath('.//td|.//th')
                 if cells:
-                    cell_texts = [cell.get_text().strip() for cell in cells[:6]]
+                    cell_texts = [cell.text_content().strip() for cell in cells[:6]]
                     print(f"    Last row data: {cell_texts}")
 
 if __name__ == "__main__":
@@ -3,47 +3,69 @@
 
 import sys
 import os
+from collections import defaultdict
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from scrapers.mipt import fetch_mipt_html
-from bs4 import BeautifulSoup
+from scrapers.mipt import fetch_mipt_html_cached
+from lxml import html
 
-def debug_it_products():
-    """Debug the IT Products Management page structure."""
+URL = "https://priem.mipt.ru/applications_v2/bWFzdGVyL1VwcmF2bGVuaWUgSVQtcHJvZHVrdGFtaV9Lb250cmFrdC5odG1s"
+
+def debug_it_products(html_content=None):
+    """Debug the IT Products Management page structure (fetches the page unless html_content is given)."""
     
-    url = "https://priem.mipt.ru/applications_v2/bWFzdGVyL1VwcmF2bGVuaWUgSVQtcHJvZHVrdGFtaV9Lb250cmFrdC5odG1s"
+    url = URL
     
     print("🔍 DEBUGGING MIPT Управление IT-продуктами")
     print("=" * 50)
     print(f"URL: {url}")
     
     # Fetch HTML
-    html_content = fetch_mipt_html(url)
+    # DEBUG_CACHE=1 reuses the page from .cache/mipt/ for an hour
+    if html_content is None:
+        html_content = fetch_mipt_html_cached(url)
     if not html_content:
         print("❌ Failed to fetch HTML")
         return
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    tree = html.fromstring(html_content)
     
-    # Check all table rows with different classes
+    # Walk the table rows once, collecting numbered data rows from the known
+    # row classes plus per-class stats for the mismatch report below
+    row_classes = ['R0', 'R11', 'R13', 'R18', 'R19', 'R45']  # R45 was visible in screenshot
     all_rows = []
-    for row_class in ['R0', 'R11', 'R13', 'R18', 'R19', 'R45']:  # Adding R45 which was visible in screenshot
-        elements = soup.find_all('tr', class_=row_class)
-        if elements:
-            print(f"\n🎯 Found {len(elements)} rows with class '{row_class}':")
+    rows_by_class = defaultdict(int)
+    class_counts = defaultdict(int)
+    numeric_rows_by_class = defaultdict(list)
+    
+    for tr in tree.iter('tr'):
+        tr_classes = (tr.get('class') or '').split()
+        first_cell_text = tr.xpath('string((.//td|.//th)[1])').strip()
+        
+        if tr_classes:
+            class_name = ' '.join(tr_classes)
+            class_counts[class_name] += 1
+            if first_cell_text.isdigit():
+                numeric_rows_by_class[class_name].append(int(first_cell_text))
+        
+        row_class = next((c for c in row_classes if c in tr_classes), None)
+        if row_class is None:
+            continue
+        rows_by_class[row_class] += 1
+        
+        if first_cell_text.isdigit():
+            row_number = int(first_cell_text)
+            all_rows.append((row_number, tr, row_class))
             
-            for elem in elements:
-                cells = elem.find_all(['td', 'th'])
-                if cells and len(cells) > 0:
-                    first_cell_text = cells[0].get_text().strip()
-                    if first_cell_text.isdigit():
-                        row_number = int(first_cell_text)
-                        all_rows.append((row_number, elem, row_class))
-                        
-                        # Show a few examples
-                        if len(all_rows) <= 5 or row_number % 50 == 0:
-                            cell_texts = [cell.get_text().strip() for cell in cells[:6]]
-                            print(f"    Row {row_number}: {cell_texts} (class: {row_class})")
+            # Show a few examples
+            if len(all_rows) <= 5 or row_number % 50 == 0:
+                cells = tr.xpath('.//td|.//th')
+                cell_texts = [cell.text_content().strip() for cell in cells[:6]]
+                print(f"    Row {row_number}: {cell_texts} (class: {row_class})")
+    
+    for row_class in row_classes:
+        if rows_by_class[row_class]:
+            print(f"\n🎯 Found {rows_by_class[row_class]} rows with class '{row_class}'")
     
     if all_rows:
         # Sort all rows by number
@@ -55,8 +77,8 @@ def debug_it_products():
         # Show last 10 rows
         print(f"\n📋 Last 10 rows:")
         for row_number, elem, row_class in all_rows[-10:]:
-            cells = elem.find_all(['td', 'th'])
-            cell_texts = [cell.get_text().strip() for cell in cells[:6]]
+            cells = elem.xpath('.//td|.//th')
+            cell_texts = [cell.text_content().strip() for cell in cells[:6]]
             print(f"  Row {row_number}: {cell_texts} (class: {row_class})")
         
         # What our current scraper would return
@@ -67,27 +89,6 @@ def debug_it_products():
         if last_row_number != 239:
             print(f"❌ MISMATCH! Found {last_row_number}, expected 239")
             
-            # Check for missing row classes
-            print(f"\n🔍 Checking for additional row classes...")
-            all_trs = soup.find_all('tr')
-            class_counts = {}
-            numeric_rows_by_class = {}
-            
-            for tr in all_trs:
-                tr_class = tr.get('class')
-                if tr_class:
-                    class_name = ' '.join(tr_class)
-                    class_counts[class_name] = class_counts.get(class_name, 0) + 1
-                    
-                    # Check if first cell is numeric
-                    cells = tr.find_all(['td', 'th'])
-                    if cells:
-                        first_cell_text = cells[0].get_text().strip()
-                        if first_cell_text.isdigit():
-                            if class_name not in numeric_rows_by_class:
-                                numeric_rows_by_class[class_name] = []
-                            numeric_rows_by_class[class_name].append(int(first_cell_text))
-            
             print(f"\nAll row classes found:")
             for class_name, count in sorted(class_counts.items()):
                 if class_name in numeric_rows_by_class:
@@ -13,8 +13,18 @@ def test_api_endpoint():
     
     try:
         import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         from datetime import date
         
+        # One keep-alive connection; connection failures are retried with
+        # backoff (urllib3 does not retry the POST itself once it was sent)
+        session = requests.Session()
+        session.mount('http://', HTTPAdapter(
+            pool_connections=1, pool_maxsize=1,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
+        
         # Test the API endpoint directly
         print("1️⃣ Testing API endpoint directly...")
         
@@ -24,7 +34,7 @@ def test_api_endpoint():
         print(f"   URL: {url}")
         print(f"   Data: {data}")
         
-        response = requests.post(url, json=data)
+        response = session.post(url, json=data, timeout=(3, 30))
         
         print(f"   Status: {response.status_code}")
         print(f"   Response: {response.text}")
@@ -37,6 +47,9 @@ def test_api_endpoint():
     except requests.exceptions.ConnectionError:
         print("❌ Dashboard not running on localhost:8080")
         print("   Start dashboard first: python dashboard.py")
+    
+    except requests.exceptions.Timeout:
+        print("❌ Dashboard did not respond within 30 seconds")
         
     except ImportError:
         print("❌ requests module not available")
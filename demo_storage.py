@@ -34,20 +34,34 @@ def demo_storage():
             for scraper in scrapers[:3]:
                 print(f"   - {scraper['scraper_id']}: {scraper['name']}")
         
-        # Test saving a result
-        print("\n3. Testing save_result...")
-        test_result = {
-            'scraper_id': 'demo_test',
-            'name': 'Demo Test - Storage Module',
-            'count': 999,
-            'status': 'success'
-        }
+        # Save the demo rows in one batch
+        print("\n3. Testing batch_save_results...")
+        test_results = [
+            {
+                'scraper_id': 'demo_test',
+                'name': 'Demo Test - Storage Module',
+                'count': 999,
+                'status': 'success'
+            },
+            {
+                'scraper_id': 'demo_batch_1',
+                'name': 'Demo Batch Test 1',
+                'count': 100,
+                'status': 'success'
+            },
+            {
+                'scraper_id': 'demo_batch_2', 
+                'name': 'Demo Batch Test 2',
+                'count': 200,
+                'status': 'success'
+            }
+        ]
         
-        success = storage.save_result(test_result)
-        if success:
-            print("   ✅ Test result saved successfully!")
+        saved_count = storage.batch_save_results(test_results)
+        if saved_count == len(test_results):
+            print(f"   ✅ Saved {saved_count} results in batch")
         else:
-            print("   ❌ Failed to save test result")
+            print(f"   ❌ Saved only {saved_count} of {len(test_results)} results")
         
         # Get today's results
         print("\n4. Getting today's results...")
@@ -62,28 +76,8 @@ def demo_storage():
                 count = result.get('count', 'N/A')
                 print(f"   {status_icon} {result['scraper_id']}: {count}")
         
-        # Test batch save
-        print("\n5. Testing batch_save_results...")
-        batch_results = [
-            {
-                'scraper_id': 'demo_batch_1',
-                'name': 'Demo Batch Test 1',
-                'count': 100,
-                'status': 'success'
-            },
-            {
-                'scraper_id': 'demo_batch_2', 
-                'name': 'Demo Batch Test 2',
-                'count': 200,
-                'status': 'success'
-            }
-        ]
-        
-        saved_count = storage.batch_save_results(batch_results)
-        print(f"   ✅ Saved {saved_count} results in batch")
-        
         # Test get scraper by ID
-        print("\n6. Testing get_scraper_by_id...")
+        print("\n5. Testing get_scraper_by_id...")
         if scrapers:
             first_scraper = scrapers[0]
             scraper = storage.get_scraper_by_id(first_scraper['scraper_id'])
@@ -93,7 +87,7 @@ def demo_storage():
                 print("   ❌ Failed to retrieve scraper")
         
         # Clean up test data
-        print("\n7. Cleaning up test data...")
+        print("\n6. Cleaning up test data...")
         # Note: We don't have a delete method, so test data will remain
         print("   ℹ️  Test data left in database for verification")
         
@@ -11,6 +11,20 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from core.registry import ScraperRegistry
 from core.storage import Storage
 
+def iter_configs(storage, page_size=500):
+    """Yield scrapers_config rows page by page."""
+    offset = 0
+    while True:
+        rows = storage.client.table('scrapers_config')\
+            .select('scraper_id')\
+            .order('scraper_id')\
+            .range(offset, offset + page_size - 1)\
+            .execute().data
+        yield from rows
+        if len(rows) < page_size:
+            return
+        offset += page_size
+
 def main():
     print("🔧 FIXING SCRAPER ID MISMATCH")
     print("=" * 50)
@@ -25,8 +39,8 @@ def main():
     print(f"Found {len(all_scrapers)} scrapers in code")
     
     # Get current database configurations
-    configs = storage.client.table('scrapers_config').select('*').execute()
-    print(f"Found {len(configs.data)} configurations in database")
+    existing_by_id = {c['scraper_id']: c for c in iter_configs(storage)}
+    print(f"Found {len(existing_by_id)} configurations in database")
     
     # Create mapping of actual scraper IDs
     code_scraper_ids = set()
@@ -40,7 +54,7 @@ def main():
         print(f"  - {sid}")
     
     # Find mismatched HSE configurations
-    db_hse_configs = [c for c in configs.data if c['scraper_id'].startswith('hse_online_')]
+    db_hse_configs = {sid: c for sid, c in existing_by_id.items() if sid.startswith('hse_online_')}
     code_hse_ids = [sid for sid in code_scraper_ids if sid.startswith('hse_')]
     
     print(f"\n🔄 HSE ID Mapping needed:")
@@ -50,40 +64,44 @@ def main():
     # Create new configurations for all code scrapers
     print(f"\n🔧 Creating/updating configurations...")
     
+    new_configs = []
     for func, config in all_scrapers:
         scraper_id = config.get('scraper_id')
         university = config.get('university', 'Unknown')
         program_name = config.get('program_name', 'Unknown')
         
         # Check if config exists
-        existing = next((c for c in configs.data if c['scraper_id'] == scraper_id), None)
+        existing = existing_by_id.get(scraper_id)
         
         if existing:
             print(f"  ✅ {scraper_id} - already exists")
         else:
-            # Create new configuration
-            new_config = {
+            # Queue new configuration
+            new_configs.append({
                 'scraper_id': scraper_id,
                 'name': f"{university} - {program_name}",
                 'enabled': True
-            }
-            
-            try:
-                result = storage.client.table('scrapers_config').insert(new_config).execute()
-                print(f"  ➕ {scraper_id} - created new config")
-            except Exception as e:
-                print(f"  ❌ {scraper_id} - error: {e}")
+            })
+    
+    # Create all missing configurations in one request
+    if new_configs:
+        try:
+            storage.client.table('scrapers_config').insert(new_configs).execute()
+            for new_config in new_configs:
+                print(f"  ➕ {new_config['scraper_id']} - created new config")
+        except Exception as e:
+            print(f"  ❌ Error creating {len(new_configs)} configs: {e}")
     
-    # Disable old HSE configurations that don't match
+    # Disable old HSE configurations that don't match, in one request
     print(f"\n🔄 Disabling old HSE configurations...")
-    for config in db_hse_configs:
-        old_id = config['scraper_id']
-        if old_id not in code_scraper_ids:
-            try:
-                storage.client.table('scrapers_config').update({'enabled': False}).eq('scraper_id', old_id).execute()
+    to_disable = [old_id for old_id in db_hse_configs if old_id not in code_scraper_ids]
+    if to_disable:
+        try:
+            storage.client.table('scrapers_config').update({'enabled': False}).in_('scraper_id', to_disable).execute()
+            for old_id in to_disable:
                 print(f"  🔴 {old_id} - disabled (no matching scraper)")
-            except Exception as e:
-                print(f"  ❌ {old_id} - error disabling: {e}")
+        except Exception as e:
+            print(f"  ❌ Error disabling {len(to_disable)} configs: {e}")
     
     print(f"\n✅ Configuration update complete!")
     print("=" * 50)
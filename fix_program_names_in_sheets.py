@@ -10,6 +10,7 @@ from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from core.dashboard_data import program_key_for
 from core.dynamic_sheets import DynamicSheetsManager
 from core.storage import Storage
 from core.logging_config import setup_logging, get_logger
@@ -19,35 +20,38 @@ setup_logging(log_level="INFO")
 logger = get_logger(__name__)
 
 
-def create_program_key(scraper_id, name):
-    """Create program key exactly as done in dynamic_sheets.py sync logic."""
-    
-    # Determine university from scraper_id
-    if scraper_id.startswith('hse_'):
-        university = 'НИУ ВШЭ'
-    elif scraper_id.startswith('mipt_'):
-        university = 'МФТИ'
-    elif scraper_id.startswith('mephi_'):
-        university = 'МИФИ'
-    else:
-        university = 'Unknown'
-    
-    program_name = name
-    
-    # Clean program name - remove university prefix if present
-    if program_name.startswith('HSE - '):
-        program_name = program_name[6:]  # Remove "HSE - "
-    elif program_name.startswith('МФТИ - '):
-        program_name = program_name[7:]  # Remove "МФТИ - "
-    elif program_name.startswith('НИЯУ МИФИ - '):
-        program_name = program_name[12:]  # Remove "НИЯУ МИФИ - "
-    elif program_name.startswith('МИФИ - '):
-        program_name = program_name[7:]  # Remove "МИФИ - "
-    elif program_name.startswith('MEPhI - '):
-        program_name = program_name[8:]  # Remove "MEPhI - "
-    
-    program_key = f"{university} - {program_name}"
-    return program_key
+def find_program_match(current_university, current_program, by_exact_key, by_program_lower):
+    """
+    Find the scraper a sheet row belongs to.
+    
+    Tries the exact program key, then the program name, then a partial match
+    where one name contains the other. Spelling variants are not matched, so
+    a similar but different program is never picked.
+    
+    Returns:
+        (scraper_id, info, match_type) tuple, or None if nothing matches
+    """
+    current_key = f"{current_university} - {current_program}"
+    current_program_lower = current_program.lower()
+    
+    if current_key in by_exact_key:
+        return (*by_exact_key[current_key], 'exact')
+    if current_program_lower in by_program_lower:
+        return (*by_program_lower[current_program_lower], 'program')
+    
+    # Partial matches are rare, only these rows scan all programs.
+    # Only the shorter name can be contained in the longer one, so
+    # one containment test per program is enough
+    best_match = None
+    current_len = len(current_program_lower)
+    for program_lower, (scraper_id, info) in by_program_lower.items():
+        if len(program_lower) < current_len:
+            contained = program_lower in current_program_lower
+        else:
+            contained = current_program_lower in program_lower
+        if contained:
+            best_match = (scraper_id, info, 'partial')
+    return best_match
 
 
 def main():
@@ -73,29 +77,20 @@ def main():
         print(f"❌ Failed to initialize: {e}")
         return 1
     
-    # Get all scrapers from database
-    try:
-        result = storage.client.table('scrapers_config')\
-            .select('scraper_id, name, enabled')\
-            .eq('enabled', True)\
-            .execute()
-        
-        if not result.data:
-            print("❌ No enabled scrapers found in database")
-            return 1
-            
-        print(f"📊 Found {len(result.data)} enabled scrapers in database")
-        
-    except Exception as e:
-        print(f"❌ Failed to fetch scrapers: {e}")
+    # Get all scrapers from database (through Storage's cached read)
+    enabled_scrapers = storage.get_enabled_scrapers()
+    if not enabled_scrapers:
+        print("❌ No enabled scrapers found in database")
         return 1
     
+    print(f"📊 Found {len(enabled_scrapers)} enabled scrapers in database")
+    
     # Create mapping of correct program keys
     correct_program_keys = {}
-    for scraper in result.data:
+    for scraper in enabled_scrapers:
         scraper_id = scraper['scraper_id']
         name = scraper['name']
-        correct_key = create_program_key(scraper_id, name)
+        correct_key = program_key_for(scraper_id, name)
         correct_program_keys[scraper_id] = {
             'key': correct_key,
             'name': name,
@@ -125,6 +120,14 @@ def main():
     
     updates_needed = []
     
+    # Index the correct keys for exact and program-name lookups (first
+    # scraper wins on duplicate program names)
+    by_exact_key = {}
+    by_program_lower = {}
+    for scraper_id, info in correct_program_keys.items():
+        by_exact_key.setdefault(info['key'], (scraper_id, info))
+        by_program_lower.setdefault(info['program'].lower(), (scraper_id, info))
+    
     # Check each row (skip header)
     for row_idx, row in enumerate(data[1:], start=2):
         if len(row) < 2:
@@ -138,21 +141,8 @@ def main():
             
         current_key = f"{current_university} - {current_program}"
         
-        # Find matching scraper by trying to match the program part
-        best_match = None
-        for scraper_id, info in correct_program_keys.items():
-            # Try exact match first
-            if info['key'] == current_key:
-                best_match = (scraper_id, info, 'exact')
-                break
-            # Try program name match
-            elif info['program'].lower() == current_program.lower():
-                best_match = (scraper_id, info, 'program')
-                break
-            # Try partial match
-            elif current_program.lower() in info['program'].lower() or info['program'].lower() in current_program.lower():
-                if not best_match or best_match[2] != 'program':
-                    best_match = (scraper_id, info, 'partial')
+        best_match = find_program_match(current_university, current_program,
+                                        by_exact_key, by_program_lower)
         
         if best_match:
             scraper_id, correct_info, match_type = best_match
@@ -200,34 +190,39 @@ def main():
     successful_updates = 0
     failed_updates = 0
     
-    for update in updates_needed:
-        try:
-            row_idx = update['row']
-            
-            # Update university (column A)
-            range_a = f"{manager.master_sheet_name}!A{row_idx}"
-            manager.service.spreadsheets().values().update(
-                spreadsheetId=manager.spreadsheet_id,
-                range=range_a,
-                valueInputOption='RAW',
-                body={'values': [[update['correct_university']]]}
-            ).execute()
-            
-            # Update program name (column B)
-            range_b = f"{manager.master_sheet_name}!B{row_idx}"
-            manager.service.spreadsheets().values().update(
-                spreadsheetId=manager.spreadsheet_id,
-                range=range_b,
-                valueInputOption='RAW',
-                body={'values': [[update['correct_program']]]}
-            ).execute()
-            
-            successful_updates += 1
-            print(f"✅ Updated row {row_idx}: {update['correct_key']}")
-            
-        except Exception as e:
-            failed_updates += 1
-            print(f"❌ Failed to update row {row_idx}: {e}")
+    # Columns A (university) and B (program) of every row in one request,
+    # with runs of consecutive rows fused into a single A:B range
+    blocks = []
+    for update in sorted(updates_needed, key=lambda u: u['row']):
+        if blocks and blocks[-1]['end'] == update['row'] - 1:
+            block = blocks[-1]
+        else:
+            block = {'start': update['row'], 'values': []}
+            blocks.append(block)
+        block['end'] = update['row']
+        block['values'].append([update['correct_university'], update['correct_program']])
+    
+    data = [
+        {
+            'range': f"{manager.master_sheet_name}!A{block['start']}:B{block['end']}",
+            'values': block['values']
+        }
+        for block in blocks
+    ]
+    
+    try:
+        manager.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=manager.spreadsheet_id,
+            body={'valueInputOption': 'RAW', 'data': data}
+        ).execute()
+        
+        successful_updates = len(updates_needed)
+        for update in updates_needed:
+            print(f"✅ Updated row {update['row']}: {update['correct_key']}")
+        
+    except Exception as e:
+        failed_updates = len(updates_needed)
+        print(f"❌ Failed to update {failed_updates} rows: {e}")
     
     print(f"\\n📊 Update Summary:")
     print(f"   ✅ Successful: {successful_updates}")
@@ -0,0 +1,35 @@
+"""
+Gunicorn configuration for the dashboard.
+
+Usage: gunicorn -c gunicorn.conf.py dashboard:app
+"""
+
+import os
+
+
+def _port():
+    """Port to bind: WEB_PORT, then PORT, then 8080 (same rules as dashboard.py)."""
+    web_port = os.environ.get('WEB_PORT')
+    if web_port and web_port.isdigit():
+        return int(web_port)
+    
+    # Railway has been seen passing PORT through as a literal '$PORT'
+    port = os.environ.get('PORT', '').strip('\'"')
+    if port.isdigit():
+        return int(port)
+    return 8080
+
+
+bind = f"0.0.0.0:{_port()}"
+
+# Threaded workers: every endpoint waits on Supabase over HTTP, so threads
+# let requests overlap during network I/O. Each worker holds its own caches
+# and Supabase client, so keep the process count small
+workers = int(os.environ.get('DASHBOARD_WORKERS', 2))
+worker_class = 'gthread'
+threads = int(os.environ.get('DASHBOARD_THREADS', 8))
+timeout = 120
+
+accesslog = '-'
+errorlog = '-'
+loglevel = 'info'
@@ -11,15 +11,25 @@ import sys
 import time
 import signal
 from datetime import datetime, date
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
+
+from dotenv import load_dotenv
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from core.logging_config import setup_logging, get_logger, log_performance
-from core.storage import Storage
-from core.registry import ScraperRegistry, get_all_scrapers
-from core.runner import ScraperRunner
+
+# Storage, registry and runner pull in the Supabase client stack; they are
+# imported in initialize_components() so a misconfigured run fails fast
+if TYPE_CHECKING:
+    from core.registry import ScraperRegistry
+    from core.runner import ScraperRunner
+
+# Load environment variables (validated before the heavy imports)
+load_dotenv()
+
+DEBUG = os.environ.get('DEBUG_MAIN') == '1'
 
 
 def setup_signal_handlers():
@@ -53,6 +63,10 @@ def initialize_components():
     """Initialize storage, registry, and runner components."""
     logger = get_logger(__name__)
     
+    from core.storage import Storage
+    from core.registry import ScraperRegistry
+    from core.runner import ScraperRunner
+    
     try:
         # Initialize storage
         logger.info("Initializing storage component...")
@@ -75,7 +89,7 @@ def initialize_components():
         raise
 
 
-def run_scrapers(registry: ScraperRegistry, runner: ScraperRunner, mode: str = "enabled") -> List[Dict[str, Any]]:
+def run_scrapers(registry: 'ScraperRegistry', runner: 'ScraperRunner', mode: str = "enabled") -> List[Dict[str, Any]]:
     """
     Run scrapers based on the specified mode.
     
@@ -141,28 +155,29 @@ def analyze_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
             'errors': []
         }
     
-    successful = [r for r in results if r.get('status') == 'success']
-    failed = [r for r in results if r.get('status') == 'error']
-    
+    # Classify, count and collect errors in one pass over the results
+    successful = 0
     total_applicants = 0
-    for result in successful:
-        count = result.get('count')
-        if count is not None and isinstance(count, (int, float)):
-            total_applicants += count
-    
     error_details = []
-    for result in failed:
-        error_details.append({
-            'scraper_id': result.get('scraper_id', 'unknown'),
-            'name': result.get('name', 'Unknown'),
-            'error': result.get('error', 'Unknown error')
-        })
+    for result in results:
+        status = result.get('status')
+        if status == 'success':
+            successful += 1
+            count = result.get('count')
+            if isinstance(count, (int, float)):
+                total_applicants += count
+        elif status == 'error':
+            error_details.append({
+                'scraper_id': result.get('scraper_id', 'unknown'),
+                'name': result.get('name', 'Unknown'),
+                'error': result.get('error', 'Unknown error')
+            })
     
     return {
         'total': len(results),
-        'successful': len(successful),
-        'failed': len(failed),
-        'success_rate': len(successful) / len(results) * 100,
+        'successful': successful,
+        'failed': len(error_details),
+        'success_rate': successful / len(results) * 100,
         'total_applicants': total_applicants,
         'errors': error_details
     }
@@ -174,29 +189,29 @@ def main():
     setup_logging(log_level="INFO")
     logger = get_logger(__name__)
     
-    # Detailed environment debugging for main.py
-    logger.info("🔍 DEBUG: main.py execution started")
-    logger.info(f"🔍 DEBUG: __file__ = {__file__}")
-    logger.info(f"🔍 DEBUG: sys.argv = {sys.argv}")
-    logger.info(f"🔍 DEBUG: Current working directory = {os.getcwd()}")
-    logger.info(f"🔍 DEBUG: Python path = {sys.path[:3]}...")  # Show first 3 paths
-    
-    # Check PORT variable in main.py environment
-    port_env = os.environ.get('PORT')
-    logger.info(f"🔍 DEBUG: PORT environment variable in main.py = '{port_env}' (type: {type(port_env)})")
-    
-    # Check all environment variables that might be relevant
-    relevant_vars = ['PORT', 'FLASK_DEBUG', 'SCRAPER_MODE', 'RAILWAY_CRON_SCHEDULE', 'PYTHONPATH']
-    for var in relevant_vars:
-        value = os.environ.get(var)
-        logger.info(f"🔍 DEBUG: {var} = '{value}'")
-    
-    # Check if any Flask-related modules are imported
-    flask_modules = [module for module in sys.modules.keys() if 'flask' in module.lower()]
-    if flask_modules:
-        logger.warning(f"🚨 DEBUG: Flask modules detected in main.py: {flask_modules}")
-    else:
-        logger.info("🔍 DEBUG: No Flask modules detected in main.py (good)")
+    # Detailed environment debugging for main.py (opt-in with DEBUG_MAIN=1)
+    if DEBUG:
+        logger.info("🔍 DEBUG: main.py execution started")
+        logger.info(f"🔍 DEBUG: __file__ = {__file__}")
+        logger.info(f"🔍 DEBUG: sys.argv = {sys.argv}")
+        logger.info(f"🔍 DEBUG: Current working directory = {os.getcwd()}")
+        logger.info(f"🔍 DEBUG: Python path = {sys.path[:3]}...")  # Show first 3 paths
+        
+        # Check PORT variable in main.py environment
+        port_env = os.environ.get('PORT')
+        logger.info(f"🔍 DEBUG: PORT environment variable in main.py = '{port_env}' (type: {type(port_env)})")
+        
+        # Check all environment variables that might be relevant
+        relevant_vars = ['PORT', 'FLASK_DEBUG', 'SCRAPER_MODE', 'RAILWAY_CRON_SCHEDULE', 'PYTHONPATH']
+        for var in relevant_vars:
+            value = os.environ.get(var)
+            logger.info(f"🔍 DEBUG: {var} = '{value}'")
+        
+        # Check if Flask got imported
+        if any(module.startswith('flask') for module in sys.modules):
+            logger.warning("🚨 DEBUG: Flask modules detected in main.py")
+        else:
+            logger.info("🔍 DEBUG: No Flask modules detected in main.py (good)")
     
     # Set up signal handlers
     setup_signal_handlers()
@@ -265,6 +280,14 @@ def main():
             if len(summary['errors']) > 10:
                 logger.error(f"  ... and {len(summary['errors']) - 10} more errors")
         
+        # Precompute the dashboard payload for the data just saved
+        try:
+            from core.dashboard_data import refresh_dashboard_cache
+            refresh_dashboard_cache(storage)
+        except Exception as e:
+            logger.error(f"Dashboard cache refresh error: {e}")
+            # Dashboard falls back to querying applicant_counts directly
+        
         # Determine exit code based on success rate
         success_threshold = float(os.getenv('SUCCESS_THRESHOLD', '0.7'))  # 70% by default
         if summary['success_rate'] < success_threshold * 100:
@@ -274,11 +297,13 @@ def main():
         
         # Sync to Google Sheets if configured
         sheets_sync_success = False
+        sheets_manager = None
         try:
-            from core.dynamic_sheets import update_dynamic_sheets
+            from core.dynamic_sheets import DynamicSheetsManager
             logger.info("Attempting to update dynamic Google Sheets...")
             
-            if update_dynamic_sheets():
+            sheets_manager = DynamicSheetsManager()
+            if sheets_manager.update_daily_data():
                 logger.info("✅ Successfully updated dynamic Google Sheets")
                 sheets_sync_success = True
             else:
@@ -287,25 +312,18 @@ def main():
             logger.error(f"Dynamic Google Sheets update error: {e}")
             # Don't fail the entire run if sheets sync fails
         
-        # Verify sync if it was successful
+        # Verify sync if it was successful, reusing the open Supabase and
+        # Sheets clients
         if sheets_sync_success:
             try:
                 logger.info("🔍 Verifying Google Sheets sync...")
-                import subprocess
-                
-                # Run verification script
-                result = subprocess.run([
-                    sys.executable, 'verify_sheets_sync.py', date.today().isoformat()
-                ], cwd=os.getcwd(), capture_output=True, text=True, timeout=120)
+                from verify_sheets_sync import verify_sync
                 
-                if result.returncode == 0:
+                if verify_sync(date.today().isoformat(), storage=storage, manager=sheets_manager) == 0:
                     logger.info("✅ Google Sheets sync verification: PASSED")
                 else:
                     logger.warning("⚠️ Google Sheets sync verification: ISSUES DETECTED")
-                    logger.warning(f"Verification output: {result.stdout}")
                     
-            except subprocess.TimeoutExpired:
-                logger.warning("⚠️ Google Sheets sync verification timed out")
             except Exception as e:
                 logger.warning(f"⚠️ Google Sheets sync verification error: {e}")
                 # Don't fail if verification fails
@@ -1,50 +1,23 @@
 #!/usr/bin/env python3
 """Add database constraints to prevent duplicates."""
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from core.storage import Storage
-from datetime import datetime
 
 def add_unique_constraint():
-    """Add unique constraint to prevent duplicate scraper_id + date combinations."""
+    """Print the unique index that prevents duplicate scraper_id + date combinations."""
     
     print("🔧 ADDING UNIQUE CONSTRAINT TO PREVENT DUPLICATES")
     print("=" * 50)
     
-    storage = Storage()
+    # The constraint itself is a unique index, created from the SQL editor
+    # (sql/create_tables.sql); the supabase client cannot run DDL
+    print("📋 Required unique index (run once in the Supabase SQL editor):")
+    print("   CREATE UNIQUE INDEX IF NOT EXISTS idx_applicant_counts_scraper_date")
+    print("       ON applicant_counts(scraper_id, date);")
     
-    try:
-        # First, let's see if there's already a unique constraint
-        print("Checking current table constraints...")
-        
-        # We can't directly add unique constraints via supabase client
-        # But we can implement UPSERT logic in our save methods
-        print("📋 Current approach: Implementing UPSERT logic in save methods")
-        
-        # Create a better save function that prevents duplicates
-        def save_unique_result(storage, result):
-            """Save result with duplicate prevention."""
-            today = datetime.now().strftime('%Y-%m-%d')
-            scraper_id = result['scraper_id']
-            
-            # First, delete any existing records for this scraper_id + date
-            delete_result = storage.client.table('applicant_counts')\
-                .delete()\
-                .eq('scraper_id', scraper_id)\
-                .eq('date', today)\
-                .execute()
-            
-            # Then insert the new record
-            return storage.save_result(result)
-        
-        print("✅ UPSERT logic defined for preventing duplicates")
-        print("\nRecommendation: Use the cleanup script after any manual runs")
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
+    # With the index in place, a whole run is saved with one bulk UPSERT
+    # on (scraper_id, date) instead of a DELETE + INSERT per result
+    print("✅ Storage.batch_save_results (core/storage.py) upserts on (scraper_id, date)")
+    print("\nRecommendation: Use the cleanup script after any manual runs")
 
 if __name__ == "__main__":
     add_unique_constraint()
\ No newline at end of file
@@ -16,6 +16,8 @@ from test_http_client import run_http_client_tests
 from test_hse import run_hse_tests
 from test_mephi import run_mephi_tests
 from test_registry import run_registry_tests
+from test_dashboard_data import run_dashboard_data_tests
+from test_fix_program_names import run_fix_program_names_tests
 from core.logging_config import setup_logging, get_logger
 
 
@@ -41,7 +43,9 @@ def run_all_tests():
         ("HTTP Client Module", run_http_client_tests),
         ("HSE Scraper Module", run_hse_tests),
         ("MEPhI Scraper Module", run_mephi_tests),
-        ("Registry Module", run_registry_tests)
+        ("Registry Module", run_registry_tests),
+        ("Dashboard Data Module", run_dashboard_data_tests),
+        ("Sheet Program Matching", run_fix_program_names_tests)
     ]
     
     all_results = {}
@@ -130,11 +134,13 @@ def run_all_tests():
     print("\n📋 TEST COVERAGE SUMMARY:")
     print("   ✅ core/storage.py      - 18 unit tests (CRUD, validation, performance)")
     print("   ✅ core/runner.py       - 13 unit tests (isolation, concurrency, error handling)")
-    print("   ✅ core/http_client.py  - 16 unit tests (timeouts, retries, reliability)")
+    print("   ✅ core/http_client.py  - 17 unit tests (timeouts, retries, reliability)")
     print("   ✅ scrapers/hse.py      - 21 unit tests (Excel parsing, fuzzy matching, data validation)")
     print("   ✅ scrapers/mephi.py    - 21 unit tests (HTML parsing, trPosBen extraction, transliteration)")
     print("   ✅ core/registry.py     - 9 unit tests (scraper discovery, configuration matching)")
-    print("   📊 Total: 98 unit tests covering all critical components and scraper implementations")
+    print("   ✅ core/dashboard_data.py - 10 unit tests (payload building, cache freshness)")
+    print("   ✅ fix_program_names_in_sheets.py - 4 unit tests (sheet row to scraper matching)")
+    print("   📊 Total: 113 unit tests covering all critical components and scraper implementations")
     
     # Return success status
     return total_success
@@ -153,6 +159,7 @@ def check_critical_components():
         ("scrapers/hse.py", "HSE Excel scraper with fuzzy matching"),
         ("scrapers/mephi.py", "MEPhI HTML scraper with trPosBen parsing"),
         ("core/registry.py", "Scraper discovery and configuration matching"),
+        ("core/dashboard_data.py", "Dashboard payload building and cache freshness"),
         ("core/logging_config.py", "Logging system (tested indirectly)")
     ]
     
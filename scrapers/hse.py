@@ -7,7 +7,7 @@ from Excel files containing program information and application counts.
 
 import io
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 import pandas as pd
 from fuzzywuzzy import fuzz
 
@@ -57,10 +57,14 @@ APPLICATION_COUNT_COLUMNS = [
 ]
 
 
-def download_hse_excel() -> Optional[pd.DataFrame]:
+def download_hse_excel(usecols: Optional[Callable[[str], bool]] = None) -> Optional[pd.DataFrame]:
     """
     Download HSE Excel file and return as pandas DataFrame.
     
+    Args:
+        usecols: Optional column-name predicate; only matching columns are
+            parsed (see pandas.read_excel)
+    
     Returns:
         DataFrame with HSE program data, or None if download fails
     """
@@ -76,7 +80,7 @@ def download_hse_excel() -> Optional[pd.DataFrame]:
             return None
         
         # Parse Excel content into DataFrame
-        df = pd.read_excel(io.BytesIO(excel_content), engine='xlrd')
+        df = pd.read_excel(io.BytesIO(excel_content), engine='xlrd', usecols=usecols)
         
         download_time = time.time() - start_time
         logger.info(f"Successfully downloaded HSE Excel file in {download_time:.2f}s - {len(df)} rows")
@@ -6,6 +6,8 @@ This module scrapes MIPT application data from HTML pages containing program
 information and extracts application counts based on data-index attributes.
 """
 
+import hashlib
+import os
 import time
 from typing import Dict, List, Any, Optional
 
@@ -86,6 +88,44 @@ def fetch_mipt_html(url: str) -> Optional[str]:
             pass
 
 
+def fetch_mipt_html_cached(url: str, max_age: float = 3600) -> Optional[str]:
+    """
+    Fetch MIPT HTML through a local disk cache, for the debug scripts.
+    
+    The cache is only used when DEBUG_CACHE=1; otherwise this is
+    fetch_mipt_html. Pages are stored in .cache/mipt/ keyed by URL hash and
+    reused for `max_age` seconds.
+    
+    Args:
+        url: MIPT program URL to fetch
+        max_age: Seconds a cached page stays fresh
+        
+    Returns:
+        HTML content as string, or None if fetch fails
+    """
+    if os.environ.get('DEBUG_CACHE') != '1':
+        return fetch_mipt_html(url)
+    
+    cache_dir = os.path.join('.cache', 'mipt')
+    path = os.path.join(cache_dir, f"{hashlib.sha256(url.encode()).hexdigest()}.html")
+    try:
+        if time.time() - os.path.getmtime(path) < max_age:
+            with open(path, 'r', encoding='utf-8') as f:
+                logger.info(f"Using cached MIPT HTML for {url}")
+                return f.read()
+    except OSError:
+        pass
+    
+    html_content = fetch_mipt_html(url)
+    if html_content is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        os.replace(tmp_path, path)
+    return html_content
+
+
 def parse_mipt_html(html_content: str) -> Optional[int]:
     """
     Parse HTML content to find data row elements and extract application count.
@@ -58,7 +58,8 @@ echo "🚀🚀🚀🚀🚀🚀🚀🚀🚀🚀🚀🚀🚀🚀🚀🚀🚀🚀
 echo ""
 
 echo "Starting Edu Parser Dashboard..."
-echo "Port: $PORT"
+# gunicorn.conf.py and dashboard.py both bind WEB_PORT first, then PORT
+echo "Port: ${WEB_PORT:-$PORT}"
 echo "Debug mode: $FLASK_DEBUG"
 
 if [ "$FLASK_DEBUG" = "true" ]; then
@@ -69,18 +70,7 @@ else
     # Production mode - use Gunicorn
     echo "Running in production mode with Gunicorn"
     
-    # Calculate workers based on CPU cores
-    WORKERS=${DASHBOARD_WORKERS:-$(python -c "import multiprocessing; print(multiprocessing.cpu_count() * 2 + 1)")}
-    
-    echo "Workers: $WORKERS"
-    
-    gunicorn \
-        --bind "0.0.0.0:${PORT}" \
-        --workers $WORKERS \
-        --worker-class sync \
-        --timeout 120 \
-        --access-logfile - \
-        --error-logfile - \
-        --log-level info \
-        dashboard:app
+    # Workers, threads and binding come from gunicorn.conf.py
+    # (DASHBOARD_WORKERS / DASHBOARD_THREADS override the defaults)
+    gunicorn -c gunicorn.conf.py dashboard:app
 fi
\ No newline at end of file
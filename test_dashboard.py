@@ -80,6 +80,44 @@ def test_health_endpoint():
         return False
 
 
+def test_get_storage_singleton():
+    """Test that get_storage() creates one Storage and reuses it."""
+    print("\nTesting shared storage instance...")
+    
+    try:
+        import threading
+        from unittest.mock import patch
+        import dashboard
+        
+        results = []
+        
+        def get_twice():
+            results.append(dashboard.get_storage())
+            results.append(dashboard.get_storage())
+        
+        with patch.object(dashboard, 'Storage') as mock_storage, \
+                patch.object(dashboard, '_storage', None):
+            # Run in a thread so a lock held across creation fails instead of hanging
+            thread = threading.Thread(target=get_twice, daemon=True)
+            thread.start()
+            thread.join(timeout=5)
+            
+            if thread.is_alive():
+                print("✗ get_storage() deadlocked")
+                return False
+            
+            same = len(results) == 2 and results[0] is results[1]
+            created_once = mock_storage.call_count == 1
+        
+        print(f"✓ Same instance returned: {same}")
+        print(f"✓ Storage created once: {created_once}")
+        return same and created_once
+        
+    except Exception as e:
+        print(f"✗ Storage singleton error: {e}")
+        return False
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -89,7 +127,8 @@ def main():
     tests = [
         test_imports(),
         test_templates(),
-        test_health_endpoint()
+        test_health_endpoint(),
+        test_get_storage_singleton()
     ]
     
     passed = sum(tests)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Unit tests for core.dashboard_data module."""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.dashboard_data import (
+    build_dashboard_payload, load_dashboard_payload, program_key_for, refresh_dashboard_cache,
+    university_for
+)
+
+
+class TestDashboardData(unittest.TestCase):
+    """Test cases for dashboard payload building and caching."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.storage = Mock()
+        self.table = self.storage.client.table.return_value
+        
+        self.storage.client.rpc.return_value.execute.return_value = Mock(data=[
+            {'scraper_id': 'hse_online_ai', 'name': 'HSE - AI', 'date': '2025-07-22', 'count': 150},
+            {'scraper_id': 'hse_online_ai', 'name': 'HSE - AI', 'date': '2025-07-21', 'count': 100},
+        ])
+        
+        self.source = {'date': '2025-07-22', 'created_at': '2025-07-22T10:00:00+00:00'}
+        self.marker_query = self.table.select.return_value.eq.return_value\
+            .order.return_value.order.return_value.limit.return_value
+        self.marker_query.execute.return_value = Mock(data=[self.source])
+        self.cache_query = self.table.select.return_value.order.return_value.limit.return_value
+    
+    def test_build_dashboard_payload(self):
+        """Test grouping results by program with growth percentage."""
+        payload = build_dashboard_payload(self.storage)
+        
+        self.assertEqual(payload['date'], '2025-07-22')
+        self.assertEqual(payload['recent_dates'], ['2025-07-22', '2025-07-21'])
+        self.storage.client.rpc.assert_called_once_with('recent_successful_results', {'n': 7})
+        self.assertEqual(payload['total'], 1)
+        self.assertEqual(payload['source'], self.source)
+        
+        program = payload['programs_data']['НИУ ВШЭ - AI']
+        self.assertEqual(program['counts_by_date'], {'2025-07-21': 100, '2025-07-22': 150})
+        self.assertEqual(program['growth_percentage'], 50.0)
+        self.assertEqual(payload['date_columns'][0], {'date': '2025-07-22', 'formatted': '22 июл'})
+    
+    def test_build_dashboard_payload_merges_scrapers_of_one_program(self):
+        """Test that growth spans the merged dates of scraper_ids sharing a program."""
+        self.storage.client.rpc.return_value.execute.return_value = Mock(data=[
+            {'scraper_id': 'hse_online_ai_v2', 'name': 'HSE - AI', 'date': '2025-07-22', 'count': 150},
+            {'scraper_id': 'hse_online_ai_v2', 'name': 'HSE - AI', 'date': '2025-07-21', 'count': 120},
+            {'scraper_id': 'hse_online_ai', 'name': 'AI', 'date': '2025-07-20', 'count': 100},
+        ])
+        
+        payload = build_dashboard_payload(self.storage)
+        
+        program = payload['programs_data']['НИУ ВШЭ - AI']
+        self.assertEqual(len(payload['programs_data']), 1)
+        self.assertEqual(program['counts_by_date'], {'2025-07-20': 100, '2025-07-21': 120, '2025-07-22': 150})
+        self.assertEqual(program['growth_percentage'], 50.0)
+        self.assertEqual(program['growth_period']['from_date'], '2025-07-20')
+    
+    def test_university_for(self):
+        """Test university lookup by scraper_id prefix."""
+        self.assertEqual(university_for('mipt_contemporary_combinatorics'), 'МФТИ')
+        self.assertEqual(university_for('mephi_software_engineering'), 'МИФИ')
+        self.assertEqual(university_for('spbu_ai'), 'Unknown')
+        self.assertEqual(university_for('spbu_ai', 'СПбГУ'), 'СПбГУ')
+    
+    def test_program_key_for(self):
+        """Test that the university prefix is replaced by the canonical university."""
+        self.assertEqual(program_key_for('hse_online_ai', 'HSE - AI'), 'НИУ ВШЭ - AI')
+        self.assertEqual(program_key_for('mephi_data_science', 'НИЯУ МИФИ - Науки о данных'), 'МИФИ - Науки о данных')
+        self.assertEqual(program_key_for('mephi_data_science', 'МИФИ - Науки о данных'), 'МИФИ - Науки о данных')
+        self.assertEqual(program_key_for('mipt_ai', 'Искусственный интеллект'), 'МФТИ - Искусственный интеллект')
+    
+    def test_build_dashboard_payload_no_data(self):
+        """Test payload when there are no successful results."""
+        self.storage.client.rpc.return_value.execute.return_value = Mock(data=[])
+        
+        payload = build_dashboard_payload(self.storage)
+        
+        self.assertIsNone(payload['date'])
+        self.assertEqual(payload['programs_data'], {})
+    
+    def test_refresh_dashboard_cache(self):
+        """Test that the payload is upserted keyed by date."""
+        self.assertTrue(refresh_dashboard_cache(self.storage))
+        
+        row = self.table.upsert.call_args[0][0]
+        self.assertEqual(row['date'], '2025-07-22')
+        self.assertIn('НИУ ВШЭ - AI', row['payload']['programs_data'])
+        self.assertEqual(self.table.upsert.call_args[1]['on_conflict'], 'date')
+    
+    def test_load_dashboard_payload_cache_hit(self):
+        """Test that a cached payload is returned without rebuilding."""
+        cached = {'date': '2025-07-22', 'programs_data': {}, 'source': self.source,
+                  'generated_at': datetime.now().isoformat()}
+        self.cache_query.execute.return_value = Mock(data=[{'payload': cached}])
+        
+        self.assertEqual(load_dashboard_payload(self.storage), cached)
+        self.storage.client.rpc.assert_not_called()
+    
+    def test_load_dashboard_payload_rebuilds_on_newer_data(self):
+        """Test that a payload built before newer applicant_counts rows is rebuilt."""
+        cached = {'date': '2025-07-21', 'programs_data': {},
+                  'source': {'date': '2025-07-21', 'created_at': '2025-07-21T10:00:00+00:00'},
+                  'generated_at': datetime.now().isoformat()}
+        self.cache_query.execute.return_value = Mock(data=[{'payload': cached}])
+        
+        payload = load_dashboard_payload(self.storage)
+        
+        self.assertEqual(payload['date'], '2025-07-22')
+        self.assertEqual(self.table.upsert.call_args[0][0]['date'], '2025-07-22')
+    
+    def test_load_dashboard_payload_rebuilds_when_old(self):
+        """Test that a payload past CACHE_MAX_AGE is rebuilt even with a matching source."""
+        cached = {'date': '2025-07-22', 'programs_data': {}, 'source': self.source,
+                  'generated_at': (datetime.now() - timedelta(days=1)).isoformat()}
+        self.cache_query.execute.return_value = Mock(data=[{'payload': cached}])
+        
+        payload = load_dashboard_payload(self.storage)
+        
+        self.assertIn('НИУ ВШЭ - AI', payload['programs_data'])
+        self.storage.client.rpc.assert_called_once()
+    
+    def test_load_dashboard_payload_falls_back(self):
+        """Test that an unavailable cache falls back to building the payload."""
+        self.cache_query.execute.side_effect = Exception("relation does not exist")
+        
+        payload = load_dashboard_payload(self.storage)
+        
+        self.assertEqual(payload['date'], '2025-07-22')
+
+
+def run_dashboard_data_tests():
+    """Run all dashboard data tests and return results."""
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestDashboardData)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    
+    return result.wasSuccessful(), len(result.failures), len(result.errors)
+
+
+if __name__ == '__main__':
+    print("Running dashboard data tests...")
+    success, failures, errors = run_dashboard_data_tests()
+    
+    if success:
+        print("✅ All dashboard data tests passed!")
+    else:
+        print(f"❌ Dashboard data tests failed: {failures} failures, {errors} errors")
+        sys.exit(1)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Unit tests for program matching in fix_program_names_in_sheets."""
+
+import os
+import sys
+import unittest
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fix_program_names_in_sheets import find_program_match
+from core.dashboard_data import program_key_for
+
+
+class TestFindProgramMatch(unittest.TestCase):
+    """Test cases for matching sheet rows to scrapers."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.scrapers = {
+            'mipt_ai_engineering': 'МФТИ - Инженерия искусственного интеллекта',
+            'hse_online_data_science': 'HSE - Магистр по наукам о данных',
+        }
+        
+        self.by_exact_key = {}
+        self.by_program_lower = {}
+        for scraper_id, name in self.scrapers.items():
+            key = program_key_for(scraper_id, name)
+            info = {'key': key, 'program': key.split(' - ', 1)[1]}
+            self.by_exact_key[key] = (scraper_id, info)
+            self.by_program_lower[info['program'].lower()] = (scraper_id, info)
+    
+    def match(self, university, program):
+        return find_program_match(university, program, self.by_exact_key, self.by_program_lower)
+    
+    def test_exact_match(self):
+        """Test that a row with the correct key matches exactly."""
+        scraper_id, _, match_type = self.match('МФТИ', 'Инженерия искусственного интеллекта')
+        
+        self.assertEqual(scraper_id, 'mipt_ai_engineering')
+        self.assertEqual(match_type, 'exact')
+    
+    def test_program_match_with_wrong_university(self):
+        """Test that a row with the right program but wrong university is matched."""
+        scraper_id, _, match_type = self.match('HSE', 'Магистр по наукам о данных')
+        
+        self.assertEqual(scraper_id, 'hse_online_data_science')
+        self.assertEqual(match_type, 'program')
+    
+    def test_partial_match_contained_name(self):
+        """Test that a shortened program name is matched by containment."""
+        scraper_id, _, match_type = self.match('НИУ ВШЭ', 'Наукам о данных')
+        
+        self.assertEqual(scraper_id, 'hse_online_data_science')
+        self.assertEqual(match_type, 'partial')
+    
+    def test_near_miss_not_remapped(self):
+        """Test that a similar but different program name is left alone."""
+        self.assertIsNone(self.match('МФТИ', 'Искусственный интеллект'))
+        self.assertIsNone(self.match('НИУ ВШЭ', 'Магистр по науке о данных'))
+
+
+def run_fix_program_names_tests():
+    """Run all program matching tests and return results."""
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestFindProgramMatch)
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    
+    return result.wasSuccessful(), len(result.failures), len(result.errors)
+
+
+if __name__ == '__main__':
+    print("Running program matching tests...")
+    success, failures, errors = run_fix_program_names_tests()
+    
+    if success:
+        print("✅ All program matching tests passed!")
+    else:
+        print(f"❌ Program matching tests failed: {failures} failures, {errors} errors")
+        sys.exit(1)
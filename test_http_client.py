@@ -4,6 +4,7 @@
 import os
 import sys
 import time
+import tempfile
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import httpx
@@ -220,6 +221,66 @@ class TestReliableHTTPClient(unittest.TestCase):
         # Should still return content despite wrong content type
         self.assertEqual(content, mock_content)
     
+    @patch('core.http_client.httpx.Client')
+    def test_cached_get_revalidates_with_etag(self, mock_client_class):
+        """Test that a 304 reply reuses the cached body."""
+        url = "https://example.com/list.xlsx"
+        
+        first = Mock()
+        first.status_code = 200
+        first.headers = httpx.Headers({"etag": '"v1"', "content-type": "application/vnd.ms-excel"})
+        first.content = b"excel v1"
+        first.raise_for_status.return_value = None
+        
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.request = httpx.Request("GET", url)
+        
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = [first, not_modified]
+        mock_client_class.return_value = mock_client_instance
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with ReliableHTTPClient(cache_dir=cache_dir) as client:
+                client.get(url)
+                response = client.get(url)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"excel v1")
+        second_headers = mock_client_instance.request.call_args_list[1][1]['headers']
+        self.assertEqual(second_headers['If-None-Match'], '"v1"')
+        not_modified.raise_for_status.assert_not_called()
+    
+    @patch('core.http_client.httpx.Client')
+    def test_cached_get_keys_on_params(self, mock_client_class):
+        """Test that GETs to one URL with different params use separate cache entries."""
+        url = "https://example.com/list"
+        
+        first = Mock()
+        first.status_code = 200
+        first.headers = httpx.Headers({"etag": '"v1"'})
+        first.content = b"page 1"
+        first.raise_for_status.return_value = None
+        
+        second = Mock()
+        second.status_code = 200
+        second.headers = httpx.Headers({"etag": '"v2"'})
+        second.content = b"page 2"
+        second.raise_for_status.return_value = None
+        
+        mock_client_instance = Mock()
+        mock_client_instance.request.side_effect = [first, second]
+        mock_client_class.return_value = mock_client_instance
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with ReliableHTTPClient(cache_dir=cache_dir) as client:
+                client.get(url, params={'page': 1})
+                response = client.get(url, params={'page': 2})
+        
+        self.assertEqual(response.content, b"page 2")
+        second_headers = mock_client_instance.request.call_args_list[1][1]['headers']
+        self.assertNotIn('If-None-Match', second_headers)
+    
     def test_context_manager(self):
         """Test that client works as context manager."""
         with ReliableHTTPClient() as client:
@@ -9,7 +9,7 @@ from unittest.mock import Mock, patch, MagicMock
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from core.registry import ScraperRegistry, get_all_scrapers, get_ready_scrapers
+from core.registry import ScraperRegistry, _default_registry, get_all_scrapers, get_ready_scrapers
 from core.storage import Storage
 
 
@@ -155,6 +155,14 @@ class TestScraperRegistry(unittest.TestCase):
 class TestRegistryConvenienceFunctions(unittest.TestCase):
     """Test convenience functions."""
     
+    def setUp(self):
+        """Reset the shared registry between tests."""
+        _default_registry.cache_clear()
+    
+    def tearDown(self):
+        """Don't leak mocked registries into other tests."""
+        _default_registry.cache_clear()
+    
     @patch('core.registry.ScraperRegistry')
     def test_get_all_scrapers(self, mock_registry_class):
         """Test get_all_scrapers convenience function."""
@@ -191,6 +199,20 @@ class TestRegistryConvenienceFunctions(unittest.TestCase):
         mock_registry.discover_scrapers.assert_called_once()
         mock_registry.load_enabled_scrapers.assert_called_once()
         self.assertEqual(len(result), 2)
+    
+    @patch('core.registry.ScraperRegistry')
+    def test_convenience_functions_share_registry(self, mock_registry_class):
+        """Test that convenience functions discover scrapers only once."""
+        mock_registry = Mock()
+        mock_registry.load_enabled_scrapers.return_value = []
+        mock_registry.get_all_discovered_scrapers.return_value = []
+        mock_registry_class.return_value = mock_registry
+        
+        get_ready_scrapers()
+        get_all_scrapers()
+        
+        mock_registry_class.assert_called_once()
+        mock_registry.discover_scrapers.assert_called_once()
 
 
 def run_registry_tests():
@@ -23,6 +23,7 @@ class TestScraperRunner(unittest.TestCase):
         # Mock storage
         self.mock_storage = Mock(spec=Storage)
         self.mock_storage.save_result.return_value = True
+        self.mock_storage.batch_save_results.side_effect = lambda results: len(results)
         
         # Create runner with mocked storage
         self.runner = ScraperRunner(storage=self.mock_storage, max_workers=2)
@@ -163,8 +164,10 @@ class TestScraperRunner(unittest.TestCase):
         self.assertEqual(len(success_results), 2)
         self.assertEqual(len(error_results), 1)
         
-        # Check that all results were saved
-        self.assertEqual(self.mock_storage.save_result.call_count, 3)
+        # Check that all results were saved in one batch
+        self.mock_storage.save_result.assert_not_called()
+        self.mock_storage.batch_save_results.assert_called_once()
+        self.assertEqual(len(self.mock_storage.batch_save_results.call_args[0][0]), 3)
     
     def test_run_all_scrapers_empty_list(self):
         """Test running with empty scraper list."""
@@ -172,6 +175,7 @@ class TestScraperRunner(unittest.TestCase):
         
         self.assertEqual(results, [])
         self.mock_storage.save_result.assert_not_called()
+        self.mock_storage.batch_save_results.assert_not_called()
     
     def test_run_all_scrapers_exception_isolation(self):
         """Test that exceptions in one scraper don't affect others."""
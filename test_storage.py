@@ -10,6 +10,8 @@ from datetime import date
 # Add the project root to the path so we can import our modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import core.storage
+from postgrest import CountMethod, ReturnMethod
 from core.storage import Storage, StorageError
 
 
@@ -25,6 +27,10 @@ class TestStorage(unittest.TestCase):
         })
         self.env_patcher.start()
         
+        # Start every test without a cached client or scraper configs
+        core.storage._clients.clear()
+        core.storage._enabled_scrapers_cache.update(ts=0.0, data=None)
+        
         # Mock the create_client function
         self.supabase_patcher = patch('core.storage.create_client')
         self.mock_create_client = self.supabase_patcher.start()
@@ -35,11 +41,15 @@ class TestStorage(unittest.TestCase):
         
         # Mock successful connection test
         self.mock_client.table.return_value.select.return_value.limit.return_value.execute.return_value = Mock(data=[])
+        
+        # Mock no results stored for today yet
+        self.mock_client.table.return_value.select.return_value.eq.return_value.execute.return_value = Mock(data=[])
     
     def tearDown(self):
         """Clean up test fixtures."""
         self.env_patcher.stop()
         self.supabase_patcher.stop()
+        core.storage._clients.clear()
     
     def test_init_success(self):
         """Test successful Storage initialization."""
@@ -69,17 +79,32 @@ class TestStorage(unittest.TestCase):
         """Test StorageError when connection test fails."""
         self.mock_client.table.return_value.select.return_value.limit.return_value.execute.side_effect = Exception("Connection failed")
         
-        with self.assertRaises(StorageError) as context:
-            Storage()
+        with patch.dict(os.environ, {'STORAGE_HEALTHCHECK': '1'}):
+            with self.assertRaises(StorageError) as context:
+                Storage()
         self.assertIn('Database connection test failed', str(context.exception))
     
+    def test_init_skips_connection_test_by_default(self):
+        """Test that no connection test query is made without STORAGE_HEALTHCHECK."""
+        with patch.dict(os.environ, {'STORAGE_HEALTHCHECK': ''}):
+            Storage()
+        self.mock_client.table.assert_not_called()
+    
+    def test_init_reuses_client(self):
+        """Test that Storage instances share one Supabase client."""
+        first = Storage()
+        second = Storage()
+        
+        self.mock_create_client.assert_called_once()
+        self.assertIs(first.client, second.client)
+    
     def test_save_result_success(self):
         """Test successful result saving."""
         storage = Storage()
         
-        # Mock successful insert
+        # Mock successful upsert
         mock_response = Mock()
-        self.mock_client.table.return_value.insert.return_value.execute.return_value = mock_response
+        self.mock_client.table.return_value.upsert.return_value.execute.return_value = mock_response
         
         result = {
             'scraper_id': 'test_scraper',
@@ -93,12 +118,19 @@ class TestStorage(unittest.TestCase):
         self.assertTrue(success)
         self.mock_client.table.assert_called_with('applicant_counts')
         
-        # Check that insert was called with correct data
-        insert_call = self.mock_client.table.return_value.insert.call_args[0][0]
-        self.assertEqual(insert_call['scraper_id'], 'test_scraper')
-        self.assertEqual(insert_call['count'], 42)
-        self.assertEqual(insert_call['status'], 'success')
-        self.assertEqual(insert_call['date'], date.today().isoformat())
+        # Check that upsert was called with correct data and conflict target
+        upsert_args, upsert_kwargs = self.mock_client.table.return_value.upsert.call_args
+        upsert_call = upsert_args[0]
+        self.assertEqual(upsert_call['scraper_id'], 'test_scraper')
+        self.assertEqual(upsert_call['count'], 42)
+        self.assertEqual(upsert_call['status'], 'success')
+        self.assertEqual(upsert_call['date'], date.today().isoformat())
+        self.assertEqual(upsert_kwargs['on_conflict'], 'scraper_id,date')
+        self.assertFalse(upsert_kwargs['ignore_duplicates'])
+        self.assertEqual(upsert_kwargs['returning'], ReturnMethod.minimal)
+        
+        # No separate delete round-trip
+        self.mock_client.table.return_value.delete.assert_not_called()
     
     def test_save_result_missing_required_field(self):
         """Test save_result with missing required field."""
@@ -133,7 +165,7 @@ class TestStorage(unittest.TestCase):
         storage = Storage()
         
         # Mock database error
-        self.mock_client.table.return_value.insert.return_value.execute.side_effect = Exception("DB Error")
+        self.mock_client.table.return_value.upsert.return_value.execute.side_effect = Exception("DB Error")
         
         result = {
             'scraper_id': 'test_scraper',
@@ -166,6 +198,24 @@ class TestStorage(unittest.TestCase):
         table_mock.select.assert_called_with('*')
         table_mock.select.return_value.eq.assert_called_with('enabled', True)
     
+    def test_get_enabled_scrapers_cached(self):
+        """Test that enabled scrapers are served from cache until invalidated."""
+        storage = Storage()
+        
+        mock_response = Mock(data=[{'scraper_id': 'test1', 'name': 'Test 1', 'enabled': True}])
+        execute = self.mock_client.table.return_value.select.return_value.eq.return_value.order.return_value.execute
+        execute.return_value = mock_response
+        
+        first = storage.get_enabled_scrapers()
+        second = storage.get_enabled_scrapers()
+        
+        self.assertEqual(first, second)
+        execute.assert_called_once()
+        
+        storage.invalidate_scrapers_cache()
+        storage.get_enabled_scrapers()
+        self.assertEqual(execute.call_count, 2)
+    
     def test_get_enabled_scrapers_database_error(self):
         """Test get_enabled_scrapers with database error."""
         storage = Storage()
@@ -201,9 +251,9 @@ class TestStorage(unittest.TestCase):
         """Test successful batch save of results."""
         storage = Storage()
         
-        # Mock successful batch insert
+        # Mock successful batch upsert
         mock_response = Mock()
-        self.mock_client.table.return_value.insert.return_value.execute.return_value = mock_response
+        self.mock_client.table.return_value.upsert.return_value.execute.return_value = mock_response
         
         results = [
             {'scraper_id': 'test1', 'name': 'Test 1', 'status': 'success', 'count': 10},
@@ -215,9 +265,87 @@ class TestStorage(unittest.TestCase):
         self.assertEqual(saved_count, 2)
         self.mock_client.table.assert_called_with('applicant_counts')
         
-        # Check that batch insert was called
-        insert_call = self.mock_client.table.return_value.insert.call_args[0][0]
-        self.assertEqual(len(insert_call), 2)
+        # Check that a single batch upsert was called
+        upsert_call = self.mock_client.table.return_value.upsert.call_args[0][0]
+        self.assertEqual(len(upsert_call), 2)
+    
+    def test_batch_save_results_skips_unchanged(self):
+        """Test that rows identical to today's stored rows are not written again."""
+        storage = Storage()
+        
+        self.mock_client.table.return_value.select.return_value.eq.return_value.execute.return_value = Mock(data=[
+            {'scraper_id': 'test1', 'name': 'Test 1', 'count': 10, 'status': 'success', 'error': None},
+            {'scraper_id': 'test2', 'name': 'Test 2', 'count': 15, 'status': 'success', 'error': None},
+            {'scraper_id': 'test3', 'name': 'Old Test 3', 'count': 30, 'status': 'success', 'error': None}
+        ])
+        
+        results = [
+            {'scraper_id': 'test1', 'name': 'Test 1', 'status': 'success', 'count': 10},
+            {'scraper_id': 'test2', 'name': 'Test 2', 'status': 'success', 'count': 20},
+            # Only the name changed
+            {'scraper_id': 'test3', 'name': 'Test 3', 'status': 'success', 'count': 30}
+        ]
+        
+        saved_count = storage.batch_save_results(results)
+        
+        self.assertEqual(saved_count, 3)
+        upsert_call = self.mock_client.table.return_value.upsert.call_args[0][0]
+        self.assertEqual([row['scraper_id'] for row in upsert_call], ['test2', 'test3'])
+    
+    def test_batch_save_results_all_unchanged(self):
+        """Test that no upsert is sent when nothing changed."""
+        storage = Storage()
+        
+        self.mock_client.table.return_value.select.return_value.eq.return_value.execute.return_value = Mock(data=[
+            {'scraper_id': 'test1', 'name': 'Test 1', 'count': 10, 'status': 'success', 'error': None}
+        ])
+        
+        saved_count = storage.batch_save_results([
+            {'scraper_id': 'test1', 'name': 'Test 1', 'status': 'success', 'count': 10}
+        ])
+        
+        self.assertEqual(saved_count, 1)
+        self.mock_client.table.return_value.upsert.assert_not_called()
+    
+    def test_batch_save_results_chunked(self):
+        """Test that large batches are split into chunk-sized upserts."""
+        storage = Storage(batch_chunk_size=2)
+        
+        results = [
+            {'scraper_id': f'test{i}', 'name': f'Test {i}', 'status': 'success', 'count': i}
+            for i in range(5)
+        ]
+        
+        saved_count = storage.batch_save_results(results)
+        
+        self.assertEqual(saved_count, 5)
+        upsert_calls = self.mock_client.table.return_value.upsert.call_args_list
+        self.assertEqual(sorted(len(call[0][0]) for call in upsert_calls), [1, 2, 2])
+    
+    def test_batch_save_results_bisects_failed_batch(self):
+        """Test that a failing batch is split to isolate the bad row."""
+        storage = Storage()
+        
+        def upsert(rows, **kwargs):
+            query = Mock()
+            if any(row['scraper_id'] == 'bad' for row in rows):
+                query.execute.side_effect = Exception("DB Error")
+            return query
+        
+        self.mock_client.table.return_value.upsert.side_effect = upsert
+        
+        results = [
+            {'scraper_id': 'test1', 'name': 'Test 1', 'status': 'success', 'count': 10},
+            {'scraper_id': 'bad', 'name': 'Bad', 'status': 'success', 'count': 20},
+            {'scraper_id': 'test3', 'name': 'Test 3', 'status': 'success', 'count': 30},
+            {'scraper_id': 'test4', 'name': 'Test 4', 'status': 'success', 'count': 40}
+        ]
+        
+        saved_count = storage.batch_save_results(results)
+        
+        self.assertEqual(saved_count, 3)
+        # 4 rows -> 2 halves -> 2 single rows of the failing half
+        self.assertEqual(self.mock_client.table.return_value.upsert.call_count, 5)
     
     def test_batch_save_results_empty_list(self):
         """Test batch_save_results with empty list."""
@@ -236,9 +364,9 @@ class TestStorage(unittest.TestCase):
             {'scraper_id': 'test3', 'name': 'Test 3', 'status': 'invalid'}  # Invalid status
         ]
         
-        # Mock successful insert for valid data
+        # Mock successful upsert for valid data
         mock_response = Mock()
-        self.mock_client.table.return_value.insert.return_value.execute.return_value = mock_response
+        self.mock_client.table.return_value.upsert.return_value.execute.return_value = mock_response
         
         saved_count = storage.batch_save_results(results)
         
@@ -277,18 +405,21 @@ class TestStorage(unittest.TestCase):
         """Test successful marking of results as synced to sheets."""
         storage = Storage()
         
-        # Mock successful update
-        mock_response = Mock()
+        # Mock successful update of 2 out of 3 ids
+        mock_response = Mock(count=2)
         self.mock_client.table.return_value.update.return_value.in_.return_value.execute.return_value = mock_response
         
         result_ids = ['id1', 'id2', 'id3']
         updated_count = storage.mark_synced_to_sheets(result_ids)
         
-        self.assertEqual(updated_count, 3)
+        # Count reported by the database, not the number of ids passed
+        self.assertEqual(updated_count, 2)
         
         # Check update parameters
         table_mock = self.mock_client.table.return_value
-        table_mock.update.assert_called_with({'synced_to_sheets': True})
+        table_mock.update.assert_called_with(
+            {'synced_to_sheets': True}, count=CountMethod.exact, returning=ReturnMethod.minimal
+        )
         table_mock.update.return_value.in_.assert_called_with('id', result_ids)
     
     def test_mark_synced_to_sheets_empty_list(self):
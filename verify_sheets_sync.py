@@ -11,6 +11,7 @@ from typing import Dict, List, Any
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from core.dashboard_data import MONTHS_RU, program_key_for
 from core.dynamic_sheets import DynamicSheetsManager
 from core.storage import Storage
 from core.logging_config import setup_logging, get_logger
@@ -20,41 +21,18 @@ setup_logging(log_level="INFO")
 logger = get_logger(__name__)
 
 
-def create_program_key(scraper_id, name):
-    """Create program key exactly as done in dynamic_sheets.py sync logic."""
+def verify_sync(target_date, storage=None, manager=None):
+    """
+    Verify Google Sheets sync for a date.
     
-    # Determine university from scraper_id
-    if scraper_id.startswith('hse_'):
-        university = 'НИУ ВШЭ'
-    elif scraper_id.startswith('mipt_'):
-        university = 'МФТИ'
-    elif scraper_id.startswith('mephi_'):
-        university = 'МИФИ'
-    else:
-        university = 'Unknown'
-    
-    program_name = name
+    Args:
+        target_date: Date in YYYY-MM-DD format
+        storage: Storage instance to reuse (created if omitted)
+        manager: DynamicSheetsManager to reuse (created if omitted)
     
-    # Clean program name - remove university prefix if present
-    if program_name.startswith('HSE - '):
-        program_name = program_name[6:]  # Remove "HSE - "
-    elif program_name.startswith('МФТИ - '):
-        program_name = program_name[7:]  # Remove "МФТИ - "
-    elif program_name.startswith('НИЯУ МИФИ - '):
-        program_name = program_name[12:]  # Remove "НИЯУ МИФИ - "
-    elif program_name.startswith('МИФИ - '):
-        program_name = program_name[7:]  # Remove "МИФИ - "
-    elif program_name.startswith('MEPhI - '):
-        program_name = program_name[8:]  # Remove "MEPhI - "
-    
-    program_key = f"{university} - {program_name}"
-    return program_key
-
-
-def main():
-    """Verify Google Sheets sync after scraper run."""
-    
-    target_date = sys.argv[1] if len(sys.argv) > 1 else date.today().isoformat()
+    Returns:
+        0 if all programs are present in the sheet, 1 otherwise
+    """
     
     print("🔍 GOOGLE SHEETS SYNC VERIFICATION")
     print("=" * 50)
@@ -62,14 +40,14 @@ def main():
     
     # Initialize components
     try:
-        manager = DynamicSheetsManager()
+        manager = manager or DynamicSheetsManager()
         
         if not manager.is_available():
             print("❌ Google Sheets service not available")
             logger.error("Google Sheets service not available for verification")
             return 1
             
-        storage = Storage()
+        storage = storage or Storage()
         logger.info("Verification components initialized successfully")
         
     except Exception as e:
@@ -105,7 +83,7 @@ def main():
         name = record['name']
         count = record['count']
         
-        program_key = create_program_key(scraper_id, name)
+        program_key = program_key_for(scraper_id, name)
         db_programs[program_key] = {
             'scraper_id': scraper_id,
             'name': name,
@@ -133,9 +111,7 @@ def main():
     # Find target date column
     header = sheet_data[0]
     date_obj = datetime.strptime(target_date, '%Y-%m-%d')
-    months = ['янв', 'фев', 'мар', 'апр', 'май', 'июн',
-             'июл', 'авг', 'сен', 'окт', 'ноя', 'дек']
-    formatted_date = f"{date_obj.day} {months[date_obj.month - 1]}"
+    formatted_date = f"{date_obj.day} {MONTHS_RU[date_obj.month - 1]}"
     
     target_column_index = None
     for i, col_header in enumerate(header):
@@ -253,6 +229,13 @@ def main():
         return 1
 
 
+def main():
+    """Verify Google Sheets sync after scraper run."""
+    
+    target_date = sys.argv[1] if len(sys.argv) > 1 else date.today().isoformat()
+    return verify_sync(target_date)
+
+
 if __name__ == "__main__":
     exit_code = main()
     sys.exit(exit_code)
\ No newline at end of file